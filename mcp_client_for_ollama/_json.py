@@ -0,0 +1,27 @@
+"""
+JSON encoding and decoding with optional orjson acceleration.
+
+orjson is used when the fast-json extra is installed; otherwise the stdlib
+json module is used. orjson.JSONDecodeError subclasses json.JSONDecodeError,
+so callers catch the same exception either way.
+
+loads: Parse JSON from bytes or str.
+dumps: Serialize to 2-space indented, UTF-8 encoded JSON bytes. Both backends
+    produce the same layout and write non-ASCII characters as-is.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
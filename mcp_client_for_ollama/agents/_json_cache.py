@@ -0,0 +1,61 @@
+"""
+Cached loading of the JSON files shipped with the agents package.
+
+Agent definitions and planner examples are read every time a DelegationClient
+is created, but they rarely change. Parsed contents are cached per path and
+invalidated when the file's modification time or size changes.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from typing import Any, Union
+
+from .._json import loads
+
+# Strings up to this length (agent types, tool names, categories, task IDs)
+# are interned; prompts and descriptions are left alone
+_INTERN_MAX_LEN = 64
+
+
+def _intern_tree(obj: Any) -> Any:
+    """Intern short strings in parsed JSON so repeated values share one object."""
+    if isinstance(obj, dict):
+        return {
+            (sys.intern(key) if len(key) <= _INTERN_MAX_LEN else key): _intern_tree(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_intern_tree(item) for item in obj]
+    if isinstance(obj, str) and len(obj) <= _INTERN_MAX_LEN:
+        return sys.intern(obj)
+    return obj
+
+
+@lru_cache(maxsize=128)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; the stat values only serve as cache key."""
+    with open(path, 'rb') as f:
+        return _intern_tree(loads(f.read()))
+
+
+def load_json(path: Union[str, os.PathLike]) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    The returned object is shared between callers and must be treated as
+    read-only; copy it before making changes.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The parsed JSON content
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    return _load_json_cached(path, stat.st_mtime_ns, stat.st_size)
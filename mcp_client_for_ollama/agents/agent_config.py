@@ -5,14 +5,16 @@ This module handles loading and managing agent type configurations from
 JSON definition files.
 """
 
-import json
+import copy
 import os
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 
+from ._json_cache import load_json
 
-@dataclass
+
+@dataclass(slots=True)
 class AgentConfig:
     """
     Configuration for a specialized agent type.
@@ -69,23 +71,37 @@ class AgentConfig:
             json.JSONDecodeError: If the file contains invalid JSON
             KeyError: If required fields are missing
         """
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        return cls.from_dict(load_json(file_path))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AgentConfig':
+        """
+        Create agent configuration from a parsed definition.
+
+        Args:
+            data: Dictionary with the fields of an agent definition file
 
+        Returns:
+            AgentConfig instance built from the dictionary
+
+        Raises:
+            KeyError: If required fields are missing
+        """
+        # Copy mutable fields so the cached definition is never mutated
         return cls(
             agent_type=data['agent_type'],
             display_name=data['display_name'],
             description=data['description'],
             system_prompt=data['system_prompt'],
-            default_tools=data['default_tools'],
-            allowed_tool_categories=data.get('allowed_tool_categories', []),
-            forbidden_tools=data.get('forbidden_tools', []),
+            default_tools=list(data['default_tools']),
+            allowed_tool_categories=list(data.get('allowed_tool_categories', [])),
+            forbidden_tools=list(data.get('forbidden_tools', [])),
             max_context_tokens=data.get('max_context_tokens', 8192),
             loop_limit=data.get('loop_limit', 2),
             temperature=data.get('temperature', 0.5),
             model=data.get('model'),  # Optional model override
             planning_hints=data.get('planning_hints'),
-            output_format=data.get('output_format'),
+            output_format=copy.deepcopy(data.get('output_format')),
             emoji=data.get('emoji'),  # Optional emoji identifier
         )
 
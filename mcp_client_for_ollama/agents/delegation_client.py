@@ -6,10 +6,13 @@ the delegation workflow: planning, task execution, and result aggregation.
 """
 
 import asyncio
+import heapq
 import json
 import os
 import re
 import time
+from collections import deque
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple
 from rich.console import Console
@@ -18,6 +21,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .task import Task, TaskStatus
 from .agent_config import AgentConfig
+from ._json_cache import load_json
 from .model_pool import ModelPool
 from ..utils.collapsible_output import CollapsibleOutput, TaskOutputCollector
 from ..utils.trace_logger import TraceLogger, TraceLoggerFactory, TraceLevel
@@ -49,6 +53,27 @@ class DelegationClient:
         result = await delegation_client.process_with_delegation(user_query)
     """
 
+    # Category keywords for matching planner examples to queries
+    CATEGORY_KEYWORDS = {
+        'multi-file-read': ['read', 'scan', 'list', 'show', 'summarize', 'files', 'all'],
+        'code-modification': ['add', 'modify', 'update', 'change', 'implement', 'create'],
+        'debugging': ['fix', 'bug', 'error', 'issue', 'broken', 'debug', 'investigate'],
+        'refactoring': ['refactor', 'restructure', 'reorganize', 'clean', 'improve'],
+        'testing': ['test', 'verify', 'check', 'validate', 'coverage'],
+        'research': ['understand', 'how does', 'explain', 'analyze', 'find', 'search'],
+        'documentation': ['document', 'doc', 'readme', 'api doc', 'write doc'],
+        'feature-implementation': ['add feature', 'implement', 'new feature'],
+        'music-creation': ['song', 'lyrics', 'music', 'suno', 'write song'],
+        'note-taking': ['obsidian', 'note', 'markdown note', 'create note'],
+        'analysis-with-execution': ['profile', 'benchmark', 'performance', 'analyze'],
+        'simple-read': ['what does', 'what is', 'show me', 'read'],
+        'simple-execute': ['run', 'execute', 'test suite'],
+        'bug-investigation': ['investigate', 'debug', 'error', '500', 'failure'],
+        'parallel-independent': ['and', 'both', 'generate and', 'write and'],
+        'mcp-tool-with-specific-data': ['append', 'add to', 'update with', 'insert', 'get note', 'modify note'],
+        'bulk-file-processing': ['all files', 'multiple files', 'each file', 'list files', 'all .md', 'all .py', 'check files']
+    }
+
     def __init__(self, mcp_client, config: Dict[str, Any]):
         """
         Initialize the delegation client.
@@ -95,6 +120,12 @@ class DelegationClient:
         # Load planning examples for few-shot learning
         self.planner_examples = self._load_planner_examples()
 
+        # Inverted index of CATEGORY_KEYWORDS for example selection
+        self._keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in self.CATEGORY_KEYWORDS.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword, []).append(category)
+
         # Initialize trace logger
         self.trace_logger = TraceLoggerFactory.from_config(config)
 
@@ -204,9 +235,8 @@ class DelegationClient:
             if not examples_path.exists():
                 return []
 
-            with open(examples_path, 'r') as f:
-                data = json.load(f)
-                return data.get('examples', [])
+            data = load_json(examples_path)
+            return list(data.get('examples', []))
         except Exception as e:
             # Don't fail if examples can't be loaded, just log and continue
             self.console.print(f"[dim yellow]Note: Could not load planner examples: {e}[/dim yellow]")
@@ -228,56 +258,39 @@ class DelegationClient:
         if not self.planner_examples:
             return []
 
-        # Category keywords for matching
-        category_keywords = {
-            'multi-file-read': ['read', 'scan', 'list', 'show', 'summarize', 'files', 'all'],
-            'code-modification': ['add', 'modify', 'update', 'change', 'implement', 'create'],
-            'debugging': ['fix', 'bug', 'error', 'issue', 'broken', 'debug', 'investigate'],
-            'refactoring': ['refactor', 'restructure', 'reorganize', 'clean', 'improve'],
-            'testing': ['test', 'verify', 'check', 'validate', 'coverage'],
-            'research': ['understand', 'how does', 'explain', 'analyze', 'find', 'search'],
-            'documentation': ['document', 'doc', 'readme', 'api doc', 'write doc'],
-            'feature-implementation': ['add feature', 'implement', 'new feature'],
-            'music-creation': ['song', 'lyrics', 'music', 'suno', 'write song'],
-            'note-taking': ['obsidian', 'note', 'markdown note', 'create note'],
-            'analysis-with-execution': ['profile', 'benchmark', 'performance', 'analyze'],
-            'simple-read': ['what does', 'what is', 'show me', 'read'],
-            'simple-execute': ['run', 'execute', 'test suite'],
-            'bug-investigation': ['investigate', 'debug', 'error', '500', 'failure'],
-            'parallel-independent': ['and', 'both', 'generate and', 'write and'],
-            'mcp-tool-with-specific-data': ['append', 'add to', 'update with', 'insert', 'get note', 'modify note'],
-            'bulk-file-processing': ['all files', 'multiple files', 'each file', 'list files', 'all .md', 'all .py', 'check files']
-        }
-
-        # Score each example by keyword relevance
+        # Score each keyword once and credit every category listing it
         query_lower = query.lower()
         query_words = set(query_lower.split())
-        scored_examples = []
+        category_scores: Dict[str, int] = {}
 
+        for keyword, categories in self._keyword_categories.items():
+            # A keyword absent from the query cannot be part of any query word either
+            if keyword not in query_lower:
+                continue
+            weight = 2
+            # Partial word match
+            if any(keyword in word for word in query_words):
+                weight += 1
+            for category in categories:
+                category_scores[category] = category_scores.get(category, 0) + weight
+
+        # Score each example by its category's keyword relevance
+        scored_examples = []
         for example in self.planner_examples:
-            score = 0
             category = example.get('category', '')
+            score = category_scores.get(category, 0)
 
             # Exact category match bonus
             if category in query_lower:
                 score += 10
 
-            # Keyword matching
-            keywords = category_keywords.get(category, [])
-            for keyword in keywords:
-                if keyword in query_lower:
-                    score += 2
-                # Partial word match
-                if any(keyword in word for word in query_words):
-                    score += 1
-
             scored_examples.append((score, example))
 
-        # Sort by score (highest first) and take top examples
-        scored_examples.sort(reverse=True, key=lambda x: x[0])
+        # Take the top examples by score (highest first, ties in file order)
+        top_examples = heapq.nlargest(max_examples, scored_examples, key=itemgetter(0))
 
         # Filter to only examples with score > 0, or take simple examples as fallback
-        relevant = [ex for score, ex in scored_examples if score > 0][:max_examples]
+        relevant = [ex for score, ex in top_examples if score > 0]
 
         # If no relevant examples found, provide simple examples as fallback
         if not relevant and self.planner_examples:
@@ -980,35 +993,30 @@ Please create a NEW plan that fixes this issue. Pay careful attention to the MAN
         Returns:
             True if circular dependencies exist, False otherwise
         """
-        # Build dependency graph
+        # Kahn's algorithm: a plan is acyclic iff every task can be peeled off
+        # once all of its dependencies have been. Iterative, so long dependency
+        # chains cannot hit the recursion limit.
         graph = {task['id']: task.get('dependencies', []) for task in tasks}
+        in_degree = {task_id: 0 for task_id in graph}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in graph}
+        for task_id, deps in graph.items():
+            for dep in deps:
+                # Unknown task IDs are reported separately by the caller
+                if dep in dependents:
+                    dependents[dep].append(task_id)
+                    in_degree[task_id] += 1
 
-        # DFS to detect cycles
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(node: str) -> bool:
-            visited.add(node)
-            rec_stack.add(node)
-
-            # Check all dependencies
-            for dep in graph.get(node, []):
-                if dep not in visited:
-                    if has_cycle(dep):
-                        return True
-                elif dep in rec_stack:
-                    return True
-
-            rec_stack.remove(node)
-            return False
-
-        # Check each task
-        for task_id in graph.keys():
-            if task_id not in visited:
-                if has_cycle(task_id):
-                    return True
-
-        return False
+        queue = deque(task_id for task_id, degree in in_degree.items() if degree == 0)
+        resolved = 0
+        while queue:
+            task_id = queue.popleft()
+            resolved += 1
+            for dependent in dependents[task_id]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        return resolved != len(in_degree)
 
     def create_tasks_from_plan(self, task_plan: Dict[str, Any]) -> List[Task]:
         """
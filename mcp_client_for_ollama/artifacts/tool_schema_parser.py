@@ -1,5 +1,6 @@
 """Tool schema parser for generating interactive forms from MCP tools."""
 
+import functools
 import re
 from typing import Dict, Any, List, Optional, Set
 from .types import UIWidget, ToolFormData, QueryBuilderData, ToolWizardData, BatchToolData
@@ -309,12 +310,17 @@ class ToolSchemaParser:
 
         return enhanced
 
-    def _infer_widget_from_name(self, prop_name: str) -> Optional[UIWidget]:
-        """Infer UI widget from property name."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _infer_widget_from_name(prop_name: str) -> Optional[UIWidget]:
+        """Infer UI widget from property name.
+
+        The result depends only on the name, so it is cached across parses.
+        """
         prop_lower = prop_name.lower()
 
         # Check keyword hints
-        for keyword, widget in self.KEYWORD_HINTS.items():
+        for keyword, widget in ToolSchemaParser.KEYWORD_HINTS.items():
             if keyword in prop_lower:
                 return widget
 
@@ -6,11 +6,13 @@ and handles bootstrapping of new memory sessions.
 """
 
 import json
+import re
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+from .._json import loads
 from .base_memory import (
     DomainMemory,
     Goal,
@@ -23,6 +25,10 @@ from .schemas import DomainType, MemorySchema
 from .storage import MemoryStorage
 
 
+# Matches ```json...``` or ```...``` wrapped around a JSON object
+_CODE_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+
 class MemoryInitializer:
     """
     Handles initialization of domain memory from INITIALIZER agent output.
@@ -175,11 +181,11 @@ class MemoryInitializer:
             # Unknown domain, use general defaults
             default_state = MemorySchema.get_domain_defaults(DomainType.GENERAL)
 
-        # Merge custom state into defaults
-        merged_state = {**default_state}
-        self._deep_merge(merged_state, custom_state)
+        # get_domain_defaults builds a fresh dict per call, so merge into it
+        # directly; only the (small) custom state is walked
+        self._deep_merge(default_state, custom_state)
 
-        return merged_state
+        return default_state
 
     def _deep_merge(self, target: dict, source: dict) -> None:
         """Deep merge source dict into target dict."""
@@ -282,6 +288,38 @@ class InitializerPromptBuilder:
     Builds prompts for the INITIALIZER agent based on domain and context.
     """
 
+    # Domain-specific guidance appended to INITIALIZER prompts
+    DOMAIN_GUIDANCE = {
+        "coding": (
+            "- Identify programming language and framework\n"
+            "- Specify test framework and test structure\n"
+            "- Define build/run commands\n"
+            "- List required dependencies\n"
+            "- Consider git workflow if applicable"
+        ),
+        "research": (
+            "- State clear, testable hypotheses\n"
+            "- Define experiments and methodologies\n"
+            "- Specify what evidence would confirm/reject hypotheses\n"
+            "- Plan literature review if needed\n"
+            "- Identify data collection requirements"
+        ),
+        "operations": (
+            "- Identify runbooks and procedures needed\n"
+            "- Define SLA targets and metrics\n"
+            "- Plan incident response workflows\n"
+            "- Set up monitoring and alerting\n"
+            "- Document recovery procedures"
+        ),
+        "content": (
+            "- Define content types and formats\n"
+            "- Specify style guide requirements\n"
+            "- Plan publication schedule\n"
+            "- Set audience engagement targets\n"
+            "- Outline content calendar"
+        ),
+    }
+
     @staticmethod
     def build_prompt(
         user_query: str,
@@ -349,37 +387,7 @@ class InitializerPromptBuilder:
     @staticmethod
     def _get_domain_guidance(domain: str) -> str:
         """Get domain-specific guidance for INITIALIZER."""
-        guidance_map = {
-            "coding": (
-                "- Identify programming language and framework\n"
-                "- Specify test framework and test structure\n"
-                "- Define build/run commands\n"
-                "- List required dependencies\n"
-                "- Consider git workflow if applicable"
-            ),
-            "research": (
-                "- State clear, testable hypotheses\n"
-                "- Define experiments and methodologies\n"
-                "- Specify what evidence would confirm/reject hypotheses\n"
-                "- Plan literature review if needed\n"
-                "- Identify data collection requirements"
-            ),
-            "operations": (
-                "- Identify runbooks and procedures needed\n"
-                "- Define SLA targets and metrics\n"
-                "- Plan incident response workflows\n"
-                "- Set up monitoring and alerting\n"
-                "- Document recovery procedures"
-            ),
-            "content": (
-                "- Define content types and formats\n"
-                "- Specify style guide requirements\n"
-                "- Plan publication schedule\n"
-                "- Set audience engagement targets\n"
-                "- Outline content calendar"
-            ),
-        }
-        return guidance_map.get(domain, "")
+        return InitializerPromptBuilder.DOMAIN_GUIDANCE.get(domain, "")
 
     @staticmethod
     def parse_initializer_response(response: str) -> Dict[str, Any]:
@@ -403,13 +411,10 @@ class InitializerPromptBuilder:
 
         # Try to extract JSON from markdown code blocks
         if "```" in response:
-            # Find JSON within code fences
-            import re
-            # Match ```json...``` or ```...```
-            code_block_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-            matches = re.findall(code_block_pattern, response, re.DOTALL)
-            if matches:
-                response = matches[0].strip()
+            # Use the JSON object in the first code fence
+            match = _CODE_BLOCK_RE.search(response)
+            if match:
+                response = match.group(1).strip()
 
         # If response still has text before/after JSON, try to extract just the JSON
         if not response.startswith("{"):
@@ -420,7 +425,7 @@ class InitializerPromptBuilder:
                 response = response[start_idx:end_idx + 1]
 
         try:
-            parsed = json.loads(response)
+            parsed = loads(response)
             # Validate required fields
             if "domain" not in parsed or "goals" not in parsed:
                 raise ValueError(f"INITIALIZER JSON missing required fields (domain, goals). Got: {list(parsed.keys())}")
@@ -5,13 +5,17 @@ Handles saving and loading memory to/from filesystem with support for
 backups, versioning, and session management.
 """
 
+import heapq
 import json
+import os
 import shutil
+from operator import attrgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import logging
 
+from .._json import dumps, loads
 from .base_memory import DomainMemory, ProgressEntry, OutcomeType
 from .schemas import MemorySchema, DomainType
 
@@ -49,6 +53,9 @@ class MemoryStorage:
             base_dir = Path.home() / ".mcp-memory"
         self.base_dir = Path(base_dir).expanduser().resolve()
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # list_sessions summaries keyed by memory.json path, each stored with
+        # the (inode, mtime, size) it was computed from
+        self._session_summaries: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
         logger.info(f"Memory storage initialized at {self.base_dir}")
 
     def _get_session_dir(self, session_id: str, domain: str) -> Path:
@@ -104,10 +111,16 @@ class MemoryStorage:
             # Update timestamp
             memory.metadata.updated_at = datetime.now()
 
-            # Save memory.json
+            # Save memory.json via a temp file and rename, so the file is
+            # never truncated in place (a hard-linked backup shares its inode)
             memory_dict = memory.to_dict()
-            with open(memory_path, 'w', encoding='utf-8') as f:
-                json.dump(memory_dict, f, indent=2, ensure_ascii=False)
+            tmp_path = memory_path.with_name(f"{memory_path.name}.{os.getpid()}.tmp")
+            try:
+                tmp_path.write_bytes(dumps(memory_dict))
+                os.replace(tmp_path, memory_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
             # Save human-readable progress.log
             self._write_progress_log(memory, session_id, domain)
@@ -143,8 +156,7 @@ class MemoryStorage:
             return None
 
         try:
-            with open(memory_path, 'r', encoding='utf-8') as f:
-                memory_dict = json.load(f)
+            memory_dict = loads(memory_path.read_bytes())
 
             # Validate structure
             is_valid, error = MemorySchema.validate_memory_structure(memory_dict)
@@ -194,64 +206,75 @@ class MemoryStorage:
             domains_to_search = [domain]
         else:
             # Search all domain directories
-            domains_to_search = [
-                d.name for d in self.base_dir.iterdir()
-                if d.is_dir()
-            ]
+            with os.scandir(self.base_dir) as it:
+                domains_to_search = [entry.name for entry in it if entry.is_dir()]
 
         for domain_name in domains_to_search:
             domain_dir = self.base_dir / domain_name
-            if not domain_dir.exists():
+            if not domain_dir.is_dir():
                 continue
 
             # Find all session directories in this domain
-            for session_dir in domain_dir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-
-                memory_path = session_dir / self.MEMORY_FILENAME
-                if not memory_path.exists():
-                    continue
+            with os.scandir(domain_dir) as it:
+                session_entries = [entry for entry in it if entry.is_dir()]
 
+            for session_entry in session_entries:
+                memory_path = os.path.join(session_entry.path, self.MEMORY_FILENAME)
                 try:
-                    # Load minimal info from memory
-                    with open(memory_path, 'r', encoding='utf-8') as f:
-                        memory_dict = json.load(f)
-
-                    metadata = memory_dict.get("metadata", {})
-
-                    # Calculate completion percentage
-                    goals = memory_dict.get("goals", [])
-                    all_features = [
-                        f for goal in goals
-                        for f in goal.get("features", [])
-                    ]
-                    completed = sum(
-                        1 for f in all_features
-                        if f.get("status") == "completed"
-                    )
-                    total = len(all_features)
-                    completion = (completed / total * 100) if total > 0 else 0
-
-                    sessions.append({
-                        "session_id": metadata.get("session_id"),
-                        "domain": metadata.get("domain"),
-                        "description": metadata.get("description"),
-                        "created_at": metadata.get("created_at"),
-                        "updated_at": metadata.get("updated_at"),
-                        "completion_percentage": completion,
-                        "total_features": total,
-                        "completed_features": completed,
-                    })
-
+                    sessions.append(dict(self._get_session_summary(memory_path)))
+                except FileNotFoundError:
+                    continue
                 except Exception as e:
-                    logger.warning(f"Failed to read session {session_dir.name}: {e}")
+                    logger.warning(f"Failed to read session {session_entry.name}: {e}")
                     continue
 
         # Sort by updated_at (most recent first)
         sessions.sort(key=lambda x: x.get("updated_at", ""), reverse=True)
         return sessions
 
+    def _get_session_summary(self, memory_path: str) -> Dict[str, Any]:
+        """
+        Summarize a session's memory.json for list_sessions.
+
+        The summary is reused until the file changes; memory.json is replaced
+        on every save, so a new inode, mtime or size means it was rewritten.
+
+        Raises:
+            FileNotFoundError: If the session has no memory.json
+        """
+        st = os.stat(memory_path)
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = self._session_summaries.get(memory_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # Load minimal info from memory
+        with open(memory_path, 'rb') as f:
+            memory_dict = loads(f.read())
+
+        metadata = memory_dict.get("metadata", {})
+
+        # Count features and completed features in one pass
+        total = completed = 0
+        for goal in memory_dict.get("goals", []):
+            for feature in goal.get("features", []):
+                total += 1
+                completed += feature.get("status") == "completed"
+        completion = (completed / total * 100) if total > 0 else 0
+
+        summary = {
+            "session_id": metadata.get("session_id"),
+            "domain": metadata.get("domain"),
+            "description": metadata.get("description"),
+            "created_at": metadata.get("created_at"),
+            "updated_at": metadata.get("updated_at"),
+            "completion_percentage": completion,
+            "total_features": total,
+            "completed_features": completed,
+        }
+        self._session_summaries[memory_path] = (key, summary)
+        return summary
+
     def delete_session(self, session_id: str, domain: str) -> bool:
         """
         Delete a session and all its data.
@@ -271,6 +294,7 @@ class MemoryStorage:
 
         try:
             shutil.rmtree(session_dir)
+            self._session_summaries.pop(str(session_dir / self.MEMORY_FILENAME), None)
             logger.info(f"Deleted session {session_id} from domain {domain}")
             return True
         except Exception as e:
@@ -297,6 +321,7 @@ class MemoryStorage:
 
         try:
             shutil.move(str(session_dir), str(archive_dir))
+            self._session_summaries.pop(str(session_dir / self.MEMORY_FILENAME), None)
             logger.info(f"Archived session {session_id} from domain {domain}")
             return True
         except Exception as e:
@@ -313,7 +338,12 @@ class MemoryStorage:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = backups_dir / f"memory_{timestamp}.json"
 
-        shutil.copy2(memory_path, backup_path)
+        # memory.json is replaced rather than rewritten on save, so a hard
+        # link keeps the old contents without copying them
+        try:
+            os.link(memory_path, backup_path)
+        except OSError:
+            shutil.copy2(memory_path, backup_path)
         logger.debug(f"Created backup at {backup_path}")
 
         # Keep only last 10 backups
@@ -321,15 +351,22 @@ class MemoryStorage:
 
     def _cleanup_old_backups(self, backups_dir: Path, keep: int = 10) -> None:
         """Remove old backups, keeping only the most recent N."""
-        backups = sorted(
-            backups_dir.glob("memory_*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
+        with os.scandir(backups_dir) as it:
+            backups = [
+                entry for entry in it
+                if entry.name.startswith("memory_") and entry.name.endswith(".json")
+            ]
+        if len(backups) <= keep:
+            return
+
+        # Names embed a sortable timestamp (memory_YYYYmmdd_HHMMSS.json), so
+        # the newest backups are the largest names; no stat calls needed
+        keepers = {entry.name for entry in heapq.nlargest(keep, backups, key=attrgetter("name"))}
 
-        for old_backup in backups[keep:]:
-            old_backup.unlink()
-            logger.debug(f"Removed old backup {old_backup}")
+        for old_backup in backups:
+            if old_backup.name not in keepers:
+                os.unlink(old_backup.path)
+                logger.debug(f"Removed old backup {old_backup.path}")
 
     def _write_progress_log(
         self,
@@ -384,6 +421,7 @@ class MemoryStorage:
                 if memory_path.exists():
                     if memory_path.stat().st_mtime < cutoff:
                         shutil.rmtree(session_dir)
+                        self._session_summaries.pop(str(memory_path), None)
                         deleted_count += 1
                         logger.info(f"Cleaned up old session {session_dir.name}")
 
@@ -2,7 +2,7 @@
 
 import io, sys, os, shutil, fnmatch, base64
 from pathlib import Path
-from typing import List, Dict, Any, Callable, Set, Optional
+from typing import List, Dict, Any, Callable, Set, Optional, Tuple
 from mcp import Tool
 from datetime import datetime
 from rich.console import Console
@@ -11,7 +11,7 @@ from rich.prompt import Confirm
 class BuiltinToolManager:
     """Manages the definition and execution of built-in tools."""
 
-    def __init__(self, model_config_manager: Any, ollama_host: str = None, config_manager: Any = None, console: Optional[Console] = None, parent_tool_manager: Any = None):
+    def __init__(self, model_config_manager: Any, ollama_host: str = None, config_manager: Any = None, console: Optional[Console] = None, parent_tool_manager: Any = None, working_directory: Optional[str] = None):
         """
         Initializes the BuiltinToolManager.
 
@@ -21,15 +21,19 @@ class BuiltinToolManager:
             config_manager: An instance of ConfigManager to interact with application config.
             console: Rich console for user prompts and output.
             parent_tool_manager: Optional reference to parent ToolManager (for accessing MCP tools).
+            working_directory: Directory that relative tool paths resolve against. Defaults to the current working directory.
         """
         self.model_config_manager = model_config_manager
         self.ollama_host = ollama_host or os.environ.get('OLLAMA_HOST', 'http://localhost:11434')
         self.config_manager = config_manager
         self.console = console or Console()
-        self.working_directory = os.getcwd()  # Store the working directory for security checks
+        self.working_directory = working_directory or os.getcwd()  # Store the working directory for security checks
         self._approved_paths: Set[str] = set()  # Store approved base directories for file access
         self.memory_tools = None  # Reference to MemoryTools instance (set when memory system is enabled)
         self.parent_tool_manager = parent_tool_manager  # Reference to parent ToolManager with all tools (builtin + MCP)
+        # Tool definitions are static, so they are built once per memory-enabled state
+        self._builtin_tools_cache: Dict[bool, Tuple[Tool, ...]] = {}
+        self._builtin_tool_index: Dict[bool, Dict[str, Tool]] = {}
         self._tool_handlers: Dict[str, Callable[[Dict[str, Any]], str]] = {
             "set_system_prompt": self._handle_set_system_prompt,
             "get_system_prompt": self._handle_get_system_prompt,
@@ -96,9 +100,44 @@ class BuiltinToolManager:
         """
         Returns a list of all built-in Tool objects.
 
+        The Tool objects are built on the first call and reused afterwards;
+        memory tools are included only while the memory system is enabled.
+
         Returns:
             A list of Tool objects for the built-in tools.
         """
+        return list(self._cached_builtin_tools())
+
+    def get_builtin_tool(self, name: str) -> Optional[Tool]:
+        """
+        Returns the built-in Tool object with the given name.
+
+        Args:
+            name: Full tool name, e.g. 'builtin.patch_file'
+
+        Returns:
+            The Tool object, or None if no such built-in tool is available.
+        """
+        self._cached_builtin_tools()
+        return self._builtin_tool_index[self.memory_tools is not None].get(name)
+
+    def _cached_builtin_tools(self) -> Tuple[Tool, ...]:
+        """Returns the cached Tool objects, building them on first use."""
+        memory_enabled = self.memory_tools is not None
+        tools = self._builtin_tools_cache.get(memory_enabled)
+        if tools is None:
+            tools = tuple(self._build_builtin_tools())
+            self._builtin_tools_cache[memory_enabled] = tools
+            self._builtin_tool_index[memory_enabled] = {tool.name: tool for tool in tools}
+        return tools
+
+    def _build_builtin_tools(self) -> List[Tool]:
+        """
+        Builds the Tool objects for all built-in tools.
+
+        Returns:
+            A list of freshly constructed Tool objects.
+        """
         set_prompt_tool = Tool(
             name="builtin.set_system_prompt",
             description="Update the system prompt for the assistant. Use this to change your instructions or persona.",
@@ -1562,8 +1601,9 @@ class BuiltinToolManager:
 
             working_dir_abs = os.path.abspath(self.working_directory)
 
-            # Check if path is outside working directory
-            if not resolved_path.startswith(working_dir_abs):
+            # Check if path is outside working directory (compare whole path
+            # components so '/work/dir2' is not treated as inside '/work/dir')
+            if resolved_path != working_dir_abs and not resolved_path.startswith(os.path.join(working_dir_abs, '')):
                 # Path is outside working directory
                 if not allow_absolute:
                     # Not internally allowed, check if we should request permission
@@ -1950,6 +1990,34 @@ class BuiltinToolManager:
                 "💡 Tip: Verify the file path and try builtin.file_exists to check if the file exists."
             )
 
+    def _write_text_atomic(self, path: str, content: str) -> None:
+        """
+        Writes text to a file by way of a temporary file and os.replace.
+
+        Readers see either the old or the new content, never a partially
+        written file, and a failed write leaves the original untouched.
+        The permissions of an existing file are preserved.
+
+        Args:
+            path: Absolute path of the file to write
+            content: Text to write (UTF-8)
+        """
+        # Replace the symlink target rather than the link itself
+        target = os.path.realpath(path)
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def _handle_write_file(self, args: Dict[str, Any]) -> str:
         """Handles the 'write_file' tool call."""
         path = args.get("path")
@@ -1986,8 +2054,7 @@ class BuiltinToolManager:
             if parent_dir:
                 os.makedirs(parent_dir, exist_ok=True)
 
-            with open(resolved_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            self._write_text_atomic(resolved_path, content)
 
             file_size = os.path.getsize(resolved_path)
             # Enhanced success message with actual location
@@ -2365,6 +2432,29 @@ class BuiltinToolManager:
         except Exception as e:
             return f"Error analyzing image '{image_path}': {type(e).__name__}: {e}"
 
+    def _find_occurrences(self, text: str, pattern: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Finds the start offsets of non-overlapping occurrences of pattern in text.
+
+        Walks the text once, resuming each search after the previous match, so
+        the offsets can be used to splice replacements without rescanning.
+
+        Args:
+            text: The text to search
+            pattern: The substring to look for
+            limit: Stop after this many matches (None for all)
+
+        Returns:
+            List of match offsets in ascending order
+        """
+        offsets: List[int] = []
+        step = len(pattern) or 1
+        pos = text.find(pattern)
+        while pos >= 0 and (limit is None or len(offsets) < limit):
+            offsets.append(pos)
+            pos = text.find(pattern, pos + step)
+        return offsets
+
     def _handle_patch_file(self, args: Dict[str, Any]) -> str:
         """
         Handles the 'patch_file' tool call.
@@ -2435,6 +2525,9 @@ class BuiltinToolManager:
                 if not isinstance(search_text, str):
                     return f"Error: Change #{idx} has non-string 'search' field."
 
+                if not search_text:
+                    return f"Error: Change #{idx} has empty 'search' field."
+
                 if not isinstance(replace_text, str):
                     return f"Error: Change #{idx} has non-string 'replace' field."
 
@@ -2442,8 +2535,11 @@ class BuiltinToolManager:
                     if not isinstance(occurrence, int) or occurrence < 1:
                         return f"Error: Change #{idx} has invalid 'occurrence' field. Must be a positive integer."
 
-                # Count occurrences of search text
-                count = current_content.count(search_text)
+                # Locate occurrences of search text, stopping as soon as the
+                # outcome is known: at the requested occurrence, or at a second
+                # match when the search text must be unique
+                offsets = self._find_occurrences(current_content, search_text, occurrence or 2)
+                count = len(offsets)
 
                 if count == 0:
                     return (
@@ -2456,13 +2552,16 @@ class BuiltinToolManager:
                 if occurrence is None:
                     # No occurrence specified - search text must be unique
                     if count > 1:
+                        # Only the error message needs the full count
+                        count = current_content.count(search_text)
                         return (
                             f"Error: Change #{idx} failed - search text appears {count} times in file.\n"
                             f"Search text: {repr(search_text[:100])}{'...' if len(search_text) > 100 else ''}\n"
                             f"Please specify which occurrence to replace using the 'occurrence' field (1-{count})."
                         )
                     # Unique match - apply the change
-                    current_content = current_content.replace(search_text, replace_text, 1)
+                    start = offsets[0]
+                    current_content = current_content[:start] + replace_text + current_content[start + len(search_text):]
                     applied_changes.append(f"  {idx}. Replaced unique occurrence")
                 else:
                     # Occurrence specified
@@ -2473,36 +2572,20 @@ class BuiltinToolManager:
                             f"Search text: {repr(search_text[:100])}{'...' if len(search_text) > 100 else ''}"
                         )
 
-                    # Find and replace the specific occurrence
-                    parts = current_content.split(search_text)
-                    if len(parts) < occurrence + 1:
-                        return f"Error: Change #{idx} failed - internal error splitting text."
-
-                    # Reconstruct with the replacement at the specific occurrence
-                    new_parts = []
-                    for i, part in enumerate(parts):
-                        new_parts.append(part)
-                        if i < len(parts) - 1:
-                            if i == occurrence - 1:
-                                new_parts.append(replace_text)
-                            else:
-                                new_parts.append(search_text)
-
-                    current_content = ''.join(new_parts)
+                    # Count the remaining matches for the summary, then splice
+                    # the replacement in at the requested offset
+                    start = offsets[-1]
+                    end = start + len(search_text)
+                    count += current_content.count(search_text, end)
+                    current_content = current_content[:start] + replace_text + current_content[end:]
                     applied_changes.append(f"  {idx}. Replaced occurrence {occurrence} of {count}")
 
             # All changes validated and applied successfully - write the file
             try:
-                with open(resolved_path, 'w', encoding='utf-8') as f:
-                    f.write(current_content)
+                self._write_text_atomic(resolved_path, current_content)
             except Exception as e:
-                # Attempt to restore original content if write fails
-                try:
-                    with open(resolved_path, 'w', encoding='utf-8') as f:
-                        f.write(original_content)
-                    return f"Error: Failed to write patched file, original restored: {type(e).__name__}: {e}"
-                except Exception:
-                    return f"Error: Failed to write patched file AND failed to restore original: {type(e).__name__}: {e}"
+                # The atomic write never touches the original on failure
+                return f"Error: Failed to write patched file, original left unchanged: {type(e).__name__}: {e}"
 
             # Calculate statistics
             original_lines = original_content.count('\n') + 1
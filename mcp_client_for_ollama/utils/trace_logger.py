@@ -9,7 +9,7 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
@@ -74,6 +74,9 @@ class TraceLogger:
         # Track entries
         self.entries: List[TraceEntry] = []
 
+        # Serialized entries held back while log_events() runs
+        self._pending_lines: Optional[List[str]] = None
+
     def is_enabled(self) -> bool:
         """Check if tracing is enabled."""
         return self.level != TraceLevel.OFF
@@ -285,6 +288,39 @@ class TraceLogger:
 
         self._write_entry(entry)
 
+    def log_events(self, events: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Log several events with a single write to the log file.
+
+        Args:
+            events: (event_type, kwargs) pairs, where event_type is one of
+                "task_start", "llm_call", "tool_call", "task_end" or
+                "planning_phase" and kwargs are passed to the matching
+                log_* method
+        """
+        if not self.is_enabled():
+            return
+
+        handlers = {
+            "task_start": self.log_task_start,
+            "llm_call": self.log_llm_call,
+            "tool_call": self.log_tool_call,
+            "task_end": self.log_task_end,
+            "planning_phase": self.log_planning_phase,
+        }
+
+        self._pending_lines = []
+        try:
+            for event_type, kwargs in events:
+                if event_type not in handlers:
+                    raise ValueError(f"Unknown trace event type: {event_type}")
+                handlers[event_type](**kwargs)
+        finally:
+            lines, self._pending_lines = self._pending_lines, None
+            if lines:
+                with open(self.log_file, 'a') as f:
+                    f.writelines(lines)
+
     def get_summary(self) -> Dict[str, Any]:
         """
         Get a summary of the trace session.
@@ -333,10 +369,15 @@ class TraceLogger:
         """Write a trace entry to the log file."""
         self.entries.append(entry)
 
-        # Write to JSON file
-        with open(self.log_file, 'a') as f:
-            json_data = asdict(entry)
-            f.write(json.dumps(json_data) + "\n")
+        line = json.dumps(asdict(entry)) + "\n"
+
+        # Inside log_events() the write is deferred to a single batch
+        if self._pending_lines is not None:
+            self._pending_lines.append(line)
+        else:
+            # Write to JSON file
+            with open(self.log_file, 'a') as f:
+                f.write(line)
 
         # Optionally print to console
         if self.console_output and self.level == TraceLevel.DEBUG:
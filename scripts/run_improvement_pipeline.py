@@ -13,6 +13,7 @@ Runs the complete chat-to-agent knowledge transfer pipeline:
 
 import asyncio
 import argparse
+import functools
 import logging
 from pathlib import Path
 import json
@@ -42,6 +43,9 @@ logger = logging.getLogger(__name__)
 class ImprovementPipelineOrchestrator:
     """Orchestrates the complete improvement pipeline."""
 
+    # Largest number of patterns per task type any phase consumes
+    _MAX_EXAMPLES_PER_TYPE = 3
+
     def __init__(self, config_path: str = None):
         """Initialize the orchestrator."""
         self.config = self._load_config(config_path) if config_path else self._get_default_config()
@@ -54,6 +58,10 @@ class ImprovementPipelineOrchestrator:
         self.dataset_creator = FineTuningDatasetCreator()
         self.fine_tuner = TargetedFineTuner()
         self.dashboard = ImprovementDashboard()
+        # (task_type, [example dicts]) pairs built once at the end of Phase 1
+        self._flat_patterns = []
+        # (phase result dict, key, task) for exports still being written
+        self._pending_exports = []
 
     def _load_config(self, path: str) -> dict:
         """Load configuration from file."""
@@ -123,9 +131,35 @@ class ImprovementPipelineOrchestrator:
         except Exception as e:
             logger.error(f"Pipeline failed: {e}", exc_info=True)
             results["error"] = str(e)
+            await self._discard_exports()
 
         return results
 
+    def _export_in_background(self, phase_result: dict, key: str, export) -> None:
+        """Run a blocking export in a worker thread so the next phase can start.
+
+        The returned path is stored in ``phase_result[key]`` once Phase 5
+        collects it.
+        """
+        task = asyncio.create_task(asyncio.to_thread(export))
+        self._pending_exports.append((phase_result, key, task))
+
+    async def _collect_exports(self) -> None:
+        """Wait for background exports and record their paths."""
+        pending, self._pending_exports = self._pending_exports, []
+        if not pending:
+            return
+
+        paths = await asyncio.gather(*(task for _, _, task in pending))
+        for (phase_result, key, _), path in zip(pending, paths):
+            phase_result[key] = path
+            logger.info("Exported %s: %s", key, path)
+
+    async def _discard_exports(self) -> None:
+        """Let outstanding exports finish after a failure without raising."""
+        pending, self._pending_exports = self._pending_exports, []
+        await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
+
     async def _phase1_analyze_chat(self) -> dict:
         """Phase 1: Analyze chat history."""
         logger.info("Loading and analyzing chat history...")
@@ -133,56 +167,65 @@ class ImprovementPipelineOrchestrator:
         # Run analysis
         analysis_results = self.chat_analyzer.analyze_all()
 
-        # Export patterns
-        patterns_file = self.chat_analyzer.export_patterns()
+        logger.info("Chat analysis complete: %d conversations analyzed", analysis_results["total_conversations"])
 
-        logger.info(f"Chat analysis complete: {analysis_results['total_conversations']} conversations analyzed")
-        logger.info(f"Patterns exported to: {patterns_file}")
+        # Patterns are read-only from here on; flatten the top ones once so
+        # later phases slice this list instead of rebuilding the same dicts.
+        self._flat_patterns = [
+            (task_type, [
+                {
+                    "user_message": {"content": p.user_message.content},
+                    "assistant_message": {
+                        "content": p.assistant_response.content,
+                        "models": p.assistant_response.models,
+                    },
+                    "success_indicators": p.success_indicators,
+                }
+                for p in patterns[:self._MAX_EXAMPLES_PER_TYPE]
+            ])
+            for task_type, patterns in self.chat_analyzer.patterns.items()
+        ]
 
-        return {
+        result = {
             "total_conversations": analysis_results["total_conversations"],
             "patterns_by_type": analysis_results["patterns_by_type"],
             "models_analyzed": list(self.chat_analyzer.model_success_rates.keys()),
-            "patterns_file": patterns_file,
             "summary": self.chat_analyzer.get_summary(),
         }
 
+        # Export patterns
+        self._export_in_background(result, "patterns_file", self.chat_analyzer.export_patterns)
+
+        return result
+
     async def _phase2_extract_knowledge(self) -> dict:
         """Phase 2: Extract transferable knowledge."""
         logger.info("Extracting transferable knowledge from chat successes...")
 
         # Get successful patterns from chat analyzer
-        successful_patterns = []
-        for task_type, patterns in self.chat_analyzer.patterns.items():
-            successful_patterns.extend([
-                {
-                    "user_message": {"content": p.user_message.content},
-                    "assistant_message": {"content": p.assistant_response.content},
-                    "success_indicators": p.success_indicators,
-                }
-                for p in patterns[:3]  # Top 3 per type
-            ])
+        successful_patterns = self._pattern_examples(3)  # Top 3 per type
 
         # Extract knowledge
         knowledge = self.knowledge_extractor.extract_transferable_knowledge(successful_patterns)
 
-        logger.info(f"Extracted {len(knowledge)} knowledge items")
+        logger.info("Extracted %d knowledge items", len(knowledge))
 
         # Generate training examples
         examples = self.example_generator.generate_agent_examples(successful_patterns)
 
-        logger.info(f"Generated {len(examples)} agent training examples")
-
-        # Export examples
-        examples_file = self.example_generator.export_examples_to_jsonl()
+        logger.info("Generated %d agent training examples", len(examples))
 
-        return {
+        result = {
             "knowledge_items": len(knowledge),
             "training_examples": len(examples),
-            "examples_file": examples_file,
             "knowledge_summary": self.knowledge_extractor.get_knowledge_summary(),
         }
 
+        # Export examples
+        self._export_in_background(result, "examples_file", self.example_generator.export_examples_to_jsonl)
+
+        return result
+
     async def _phase3_improvement_cycles(self) -> dict:
         """Phase 3: Run improvement cycles."""
         logger.info("Running improvement cycles for configured models...")
@@ -190,7 +233,7 @@ class ImprovementPipelineOrchestrator:
         cycle_results = []
 
         for model in self.config.get("models_to_optimize", [])[:2]:  # Test with 2 models
-            logger.info(f"Running improvement cycle for {model}")
+            logger.info("Running improvement cycle for %s", model)
 
             cycle = await self.improvement_loop.improvement_cycle(
                 model,
@@ -207,20 +250,23 @@ class ImprovementPipelineOrchestrator:
             })
 
             logger.info(
-                f"  Baseline: {cycle.baseline_score:.1f}% -> "
-                f"New: {cycle.new_score:.1f}% (Improvement: {cycle.improvement_percentage:.1f}%)"
+                "  Baseline: %.1f%% -> New: %.1f%% (Improvement: %.1f%%)",
+                cycle.baseline_score,
+                cycle.new_score,
+                cycle.improvement_percentage,
             )
 
-        # Export cycle results
-        cycles_file = self.improvement_loop.export_cycle_results()
-
-        return {
+        result = {
             "cycles_completed": len(cycle_results),
             "results": cycle_results,
-            "cycles_file": cycles_file,
             "metrics": self.improvement_loop.get_improvement_metrics(),
         }
 
+        # Export cycle results
+        self._export_in_background(result, "cycles_file", self.improvement_loop.export_cycle_results)
+
+        return result
+
     async def _phase4_fine_tuning(self) -> dict:
         """Phase 4: Create fine-tuning datasets and train models."""
         logger.info("Creating fine-tuning datasets...")
@@ -229,38 +275,34 @@ class ImprovementPipelineOrchestrator:
 
         models = self.config.get("models_to_optimize", [])[:1]  # Focus on top model
         targets = self.config.get("fine_tuning_targets", [])
+        chat_examples = self._get_chat_examples()
+
+        # Dataset builder for each supported weakness
+        dataset_builders = {
+            "tool_calling": self.dataset_creator.create_tool_calling_dataset,
+            "formatting": self.dataset_creator.create_format_fixing_dataset,
+            "reasoning": self.dataset_creator.create_reasoning_dataset,
+        }
 
         for model in models:
             for weakness in targets:
-                logger.info(f"Creating {weakness} dataset for {model}...")
+                create_dataset = dataset_builders.get(weakness)
+                if not create_dataset:
+                    continue
+
+                logger.info("Creating %s dataset for %s...", weakness, model)
 
                 # Create appropriate dataset
-                if weakness == "tool_calling":
-                    examples = self.dataset_creator.create_tool_calling_dataset(
-                        model,
-                        self._get_chat_examples()
-                    )
-                elif weakness == "formatting":
-                    examples = self.dataset_creator.create_format_fixing_dataset(
-                        model,
-                        self._get_chat_examples()
-                    )
-                elif weakness == "reasoning":
-                    examples = self.dataset_creator.create_reasoning_dataset(
-                        model,
-                        self._get_chat_examples()
-                    )
-                else:
-                    continue
+                examples = create_dataset(model, chat_examples)
 
-                logger.info(f"Created {len(examples)} training examples for {weakness}")
+                logger.info("Created %d training examples for %s", len(examples), weakness)
 
                 # Export dataset
                 dataset_file = self.dataset_creator.export_to_jsonl(examples)
-                logger.info(f"Dataset exported to: {dataset_file}")
+                logger.info("Dataset exported to: %s", dataset_file)
 
                 # Run fine-tuning
-                logger.info(f"Fine-tuning {model} for {weakness}...")
+                logger.info("Fine-tuning %s for %s...", model, weakness)
                 result = await self.fine_tuner.fine_tune_for_weakness(
                     model,
                     weakness,
@@ -275,7 +317,7 @@ class ImprovementPipelineOrchestrator:
                     "new_model": result.new_model_name,
                 })
 
-                logger.info(f"  Fine-tuning result: {result.improvement_percentage:.1f}% improvement")
+                logger.info("  Fine-tuning result: %.1f%% improvement", result.improvement_percentage)
 
         # Export fine-tuning results
         results_file = self.fine_tuner.export_results()
@@ -291,6 +333,9 @@ class ImprovementPipelineOrchestrator:
         """Phase 5: Generate comprehensive reports."""
         logger.info("Generating improvement reports...")
 
+        # Earlier phases' exports ran alongside later work; finish them now
+        await self._collect_exports()
+
         # Generate dashboard metrics
         metrics = self.dashboard.get_improvement_metrics(
             self.improvement_loop,
@@ -308,7 +353,7 @@ class ImprovementPipelineOrchestrator:
         # Export report
         report_file = self.dashboard.export_report(report)
 
-        logger.info(f"Improvement report exported to: {report_file}")
+        logger.info("Improvement report exported to: %s", report_file)
 
         return {
             "metrics": {
@@ -324,26 +369,21 @@ class ImprovementPipelineOrchestrator:
             "report_file": report_file,
         }
 
-    def _get_chat_examples(self) -> list:
-        """Get chat examples for training data creation."""
+    def _pattern_examples(self, per_type: int) -> list:
+        """Return up to ``per_type`` flattened chat examples for each task type."""
         examples = []
-
-        for task_type, patterns in self.chat_analyzer.patterns.items():
-            for pattern in patterns[:2]:  # Get a few examples per type
-                examples.append({
-                    "user_message": {"content": pattern.user_message.content},
-                    "assistant_message": {
-                        "content": pattern.assistant_response.content,
-                        "models": pattern.assistant_response.models,
-                    },
-                    "success_indicators": pattern.success_indicators,
-                })
-
+        for _task_type, type_examples in self._flat_patterns:
+            examples.extend(type_examples[:per_type])
         return examples
 
+    def _get_chat_examples(self) -> list:
+        """Get chat examples for training data creation."""
+        return self._pattern_examples(2)  # Get a few examples per type
+
 
-async def main():
-    """Main entry point."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (cached for repeat invocations)."""
     parser = argparse.ArgumentParser(
         description="Run the complete Chat-to-Agent improvement pipeline"
     )
@@ -364,7 +404,12 @@ async def main():
         help="Verbose output"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+async def main():
+    """Main entry point."""
+    args = _build_parser().parse_args()
 
     # Create orchestrator
     orchestrator = ImprovementPipelineOrchestrator(args.config)
@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import logging
 import sys
@@ -41,7 +42,7 @@ def load_config(config_path: str = None) -> dict:
         with open(path, 'r') as f:
             return json.load(f)
     else:
-        logger.warning(f"Config file not found: {path}")
+        logger.warning("Config file not found: %s", path)
         return {}
 
 
@@ -69,8 +70,9 @@ def extract_config_values(config: dict) -> dict:
     return extracted
 
 
-def main():
-    """Main entry point"""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (cached for repeat invocations)"""
     parser = argparse.ArgumentParser(
         description="Run fine-tuning on remote GPU server",
         epilog="Example: python run_remote_finetuning.py --config config.remote-finetune.json --model qwen2.5-coder:32b --dataset data/training.jsonl"
@@ -98,6 +100,12 @@ def main():
     # Utilities
     parser.add_argument('--status-only', action='store_true', help='Just check remote status')
 
+    return parser
+
+
+def main():
+    """Main entry point"""
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Load config file if provided
@@ -170,10 +178,10 @@ def main():
     # Verify dataset exists
     dataset_path = Path(dataset)
     if not dataset_path.exists():
-        logger.error(f"Dataset file not found: {dataset}")
+        logger.error("Dataset file not found: %s", dataset)
         return 1
 
-    logger.info(f"Dataset size: {dataset_path.stat().st_size / 1024 / 1024:.1f} MB")
+    logger.info("Dataset size: %.1f MB", dataset_path.stat().st_size / 1024 / 1024)
 
     # Create fine-tuning config
     if not output_model:
@@ -190,18 +198,18 @@ def main():
         max_steps=max_steps
     )
 
-    logger.info(f"Configuration loaded from: {'config file' if args.config else 'defaults and CLI arguments'}")
+    logger.info("Configuration loaded from: %s", "config file" if args.config else "defaults and CLI arguments")
     if args.config:
-        logger.info(f"Config file: {args.config}")
+        logger.info("Config file: %s", args.config)
 
-    logger.info(f"Starting fine-tuning job...")
-    logger.info(f"  Remote server: {user}@{host}:{port}")
-    logger.info(f"  Model: {ft_config.model_name}")
-    logger.info(f"  Output: {ft_config.output_model_name}")
-    logger.info(f"  Dataset: {dataset}")
-    logger.info(f"  Learning rate: {ft_config.learning_rate}")
-    logger.info(f"  Batch size: {ft_config.batch_size}")
-    logger.info(f"  Epochs: {ft_config.num_epochs}")
+    logger.info("Starting fine-tuning job...")
+    logger.info("  Remote server: %s@%s:%s", user, host, port)
+    logger.info("  Model: %s", ft_config.model_name)
+    logger.info("  Output: %s", ft_config.output_model_name)
+    logger.info("  Dataset: %s", dataset)
+    logger.info("  Learning rate: %s", ft_config.learning_rate)
+    logger.info("  Batch size: %s", ft_config.batch_size)
+    logger.info("  Epochs: %s", ft_config.num_epochs)
 
     # Run fine-tuning
     success, result = tuner.fine_tune_ollama(ft_config)
@@ -213,13 +221,13 @@ def main():
         logger.info("✓ Fine-tuning completed successfully")
 
         # Check if model is available
-        logger.info(f"Verifying fine-tuned model...")
+        logger.info("Verifying fine-tuned model...")
         available, location = tuner.get_fine_tuned_model(output_model)
 
         if available:
-            logger.info(f"✓ Model available at: {location}")
+            logger.info("✓ Model available at: %s", location)
         else:
-            logger.warning(f"Model {output_model} not found after fine-tuning")
+            logger.warning("Model %s not found after fine-tuning", output_model)
 
         return 0
     else:
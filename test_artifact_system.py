@@ -1,8 +1,63 @@
-#!/usr/bin/env python3
 """Test script for artifact system components."""
 
-import sys
-from datetime import datetime
+import re
+
+import pytest
+
+from mcp_client_for_ollama.artifacts import (
+    ArtifactDetector,
+    ToolSchemaParser,
+    ArtifactContextManager,
+)
+from mcp_client_for_ollama.tools.builtin import BuiltinToolManager
+
+
+# LLM output containing one spreadsheet artifact
+_DETECTOR_FIXTURE = """
+Here's a test artifact:
+
+```artifact:spreadsheet
+{
+  "type": "artifact:spreadsheet",
+  "version": "1.0",
+  "title": "Test Data",
+  "data": {
+    "columns": [{"id": "name", "label": "Name", "type": "string"}],
+    "rows": [{"name": "Test"}]
+  }
+}
+```
+"""
+
+
+@pytest.fixture(scope="module")
+def ctx_mgr():
+    """Artifact context manager shared by the context tests.
+
+    Each test reads its own session so the shared manager doesn't change
+    what reference resolution returns.
+    """
+    manager = ArtifactContextManager()
+
+    manager.record_execution(
+        session_id="read_session",
+        artifact_type="toolform",
+        artifact_title="Read File",
+        tool_name="builtin.read_file",
+        tool_args={"path": "README.md"},
+        tool_result="# Test Project\n\nThis is a test."
+    )
+
+    manager.record_execution(
+        session_id="list_session",
+        artifact_type="toolform",
+        artifact_title="List Files",
+        tool_name="builtin.list_files",
+        tool_args={"path": "src"},
+        tool_result="src/main.py\nsrc/utils.py\nsrc/__init__.py"
+    )
+
+    return manager
 
 
 def test_imports():
@@ -20,126 +75,101 @@ def test_imports():
             ArtifactExecution,
         )
         print("✓ All artifact modules imported successfully")
-        return True
     except ImportError as e:
-        print(f"✗ Import failed: {e}")
-        return False
+        pytest.fail(f"Import failed: {e}")
 
 
 def test_artifact_detector():
     """Test artifact detector functionality."""
     print("\nTesting ArtifactDetector...")
 
-    from mcp_client_for_ollama.artifacts import ArtifactDetector
-
     detector = ArtifactDetector()
 
     # Test detection
-    llm_output = """
-Here's a test artifact:
+    artifacts = detector.detect(_DETECTOR_FIXTURE)
 
-```artifact:spreadsheet
-{
-  "type": "artifact:spreadsheet",
-  "version": "1.0",
-  "title": "Test Data",
-  "data": {
-    "columns": [{"id": "name", "label": "Name", "type": "string"}],
-    "rows": [{"name": "Test"}]
-  }
-}
-```
-"""
+    assert len(artifacts) == 1, f"Expected 1 artifact, got {len(artifacts)}"
 
-    artifacts = detector.detect(llm_output)
+    print(f"✓ Detected 1 artifact")
+    artifact = artifacts[0]
+    print(f"  Type: {artifact['type']}")
+    print(f"  Title: {artifact['title']}")
 
-    if len(artifacts) == 1:
-        print(f"✓ Detected 1 artifact")
-        artifact = artifacts[0]
-        print(f"  Type: {artifact['type']}")
-        print(f"  Title: {artifact['title']}")
-        return True
-    else:
-        print(f"✗ Expected 1 artifact, got {len(artifacts)}")
-        return False
 
+def test_detector_compiles_once():
+    """Test that detect() reuses the detector's precompiled patterns."""
+    print("\nTesting ArtifactDetector pattern reuse...")
 
-def test_context_manager():
-    """Test artifact context manager functionality."""
-    print("\nTesting ArtifactContextManager...")
+    assert isinstance(ArtifactDetector.ARTIFACT_PATTERN, re.Pattern)
+    assert isinstance(ArtifactDetector.JSON_ARTIFACT_PATTERN, re.Pattern)
 
-    from mcp_client_for_ollama.artifacts import ArtifactContextManager
+    # Every detector shares the class-level pattern objects
+    first, second = ArtifactDetector(), ArtifactDetector()
+    for name in ("ARTIFACT_PATTERN", "JSON_ARTIFACT_PATTERN"):
+        assert getattr(first, name) is getattr(second, name) is getattr(ArtifactDetector, name)
 
-    manager = ArtifactContextManager()
+    # re.compile and the module-level re.search/finditer/sub all go through
+    # re._compile, so nothing may reach it while detecting
+    compile_calls = []
+    real_compile = re._compile
 
-    # Record an execution
-    execution = manager.record_execution(
-        session_id="test_session",
-        artifact_type="toolform",
-        artifact_title="Read File",
-        tool_name="builtin.read_file",
-        tool_args={"path": "README.md"},
-        tool_result="# Test Project\n\nThis is a test."
-    )
+    def counting_compile(*args, **kwargs):
+        compile_calls.append(args)
+        return real_compile(*args, **kwargs)
+
+    with pytest.MonkeyPatch.context() as patcher:
+        patcher.setattr(re, "_compile", counting_compile)
+        for _ in range(5):
+            assert len(first.detect(_DETECTOR_FIXTURE)) == 1
+
+    assert not compile_calls, f"detect() compiled {len(compile_calls)} pattern(s)"
+
+    print("✓ Patterns compiled once at class definition")
+
+
+def test_context_manager(ctx_mgr):
+    """Test artifact context manager functionality."""
+    print("\nTesting ArtifactContextManager...")
+
+    # The fixture recorded a read_file execution for this session
+    execution = ctx_mgr.get_or_create_context("read_session").last_execution
 
     print(f"✓ Recorded execution: {execution.execution_id}")
     print(f"  Summary: {execution.result_summary}")
 
     # Test reference resolution
-    referenced = manager.resolve_references(
-        "test_session",
+    referenced = ctx_mgr.resolve_references(
+        "read_session",
         "what I just loaded"
     )
 
-    if len(referenced) == 1:
-        print(f"✓ Resolved temporal reference")
-        return True
-    else:
-        print(f"✗ Failed to resolve reference")
-        return False
+    assert len(referenced) == 1, "Failed to resolve reference"
+
+    print(f"✓ Resolved temporal reference")
 
 
-def test_context_message():
+def test_context_message(ctx_mgr):
     """Test context message building."""
     print("\nTesting context message building...")
 
-    from mcp_client_for_ollama.artifacts import ArtifactContextManager
-
-    manager = ArtifactContextManager()
-
-    # Record execution
-    manager.record_execution(
-        session_id="test_session",
-        artifact_type="toolform",
-        artifact_title="List Files",
-        tool_name="builtin.list_files",
-        tool_args={"path": "src"},
-        tool_result="src/main.py\nsrc/utils.py\nsrc/__init__.py"
-    )
-
-    # Build context message
-    msg = manager.build_context_message(
-        session_id="test_session",
+    # Build context message from the fixture's list_files execution
+    msg = ctx_mgr.build_context_message(
+        session_id="list_session",
         user_query="what files are there?",
         include_recent=1
     )
 
-    if msg and msg['role'] == 'system':
-        print(f"✓ Built context message")
-        print(f"  Role: {msg['role']}")
-        print(f"  Content preview: {msg['content'][:100]}...")
-        return True
-    else:
-        print(f"✗ Failed to build context message")
-        return False
+    assert msg and msg['role'] == 'system', "Failed to build context message"
+
+    print(f"✓ Built context message")
+    print(f"  Role: {msg['role']}")
+    print(f"  Content preview: {msg['content'][:100]}...")
 
 
 def test_tool_schema_parser():
     """Test tool schema parser."""
     print("\nTesting ToolSchemaParser...")
 
-    from mcp_client_for_ollama.artifacts import ToolSchemaParser
-
     # Create a mock tool manager
     class MockToolManager:
         def get_builtin_tools(self):
@@ -150,13 +180,23 @@ def test_tool_schema_parser():
     # Test widget inference
     widget = parser._infer_widget_from_name("file_path")
 
-    if widget:
-        print(f"✓ Widget inference working")
-        print(f"  'file_path' → {widget.value}")
-        return True
-    else:
-        print(f"✗ Widget inference failed")
-        return False
+    assert widget, "Widget inference failed"
+
+    print(f"✓ Widget inference working")
+    print(f"  'file_path' → {widget.value}")
+
+
+def test_widget_inference_is_cached():
+    """Widget inference for a property name is computed once."""
+    ToolSchemaParser._infer_widget_from_name.cache_clear()
+    parser = ToolSchemaParser()
+
+    first = parser._infer_widget_from_name("file_path")
+    second = parser._infer_widget_from_name("file_path")
+
+    info = ToolSchemaParser._infer_widget_from_name.cache_info()
+    assert first is second
+    assert (info.misses, info.hits) == (1, 1)
 
 
 def test_builtin_tools():
@@ -164,8 +204,6 @@ def test_builtin_tools():
     print("\nTesting builtin tools...")
 
     # Just test that the tool handler methods exist
-    from mcp_client_for_ollama.tools.builtin import BuiltinToolManager
-
     # Check the tool manager has the handler methods
     expected_handlers = [
         "_handle_generate_tool_form",
@@ -182,79 +220,13 @@ def test_builtin_tools():
         def get_system_prompt(self):
             return self.system_prompt
 
-    try:
-        config = MockConfig()
-        tool_manager = BuiltinToolManager(config, ollama_host="http://localhost:11434")
-
-        # Check handlers exist
-        found = []
-        for handler in expected_handlers:
-            if hasattr(tool_manager, handler):
-                found.append(handler)
-
-        if len(found) == len(expected_handlers):
-            print(f"✓ All 4 artifact tool handlers registered")
-            for handler in found:
-                print(f"  - {handler}")
-            return True
-        else:
-            print(f"✗ Expected 4 handlers, found {len(found)}")
-            return False
-
-    except Exception as e:
-        print(f"✗ Failed to create tool manager: {e}")
-        return False
-
-
-def main():
-    """Run all tests."""
-    print("=" * 60)
-    print("Artifact System Test Suite")
-    print("Version: 0.44.0")
-    print("=" * 60)
-
-    tests = [
-        ("Import Test", test_imports),
-        ("Artifact Detector", test_artifact_detector),
-        ("Context Manager", test_context_manager),
-        ("Context Message", test_context_message),
-        ("Tool Schema Parser", test_tool_schema_parser),
-        ("Builtin Tools", test_builtin_tools),
-    ]
-
-    results = []
-
-    for name, test_func in tests:
-        try:
-            result = test_func()
-            results.append((name, result))
-        except Exception as e:
-            print(f"✗ {name} raised exception: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append((name, False))
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("Test Summary")
-    print("=" * 60)
-
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-
-    for name, result in results:
-        status = "✓ PASS" if result else "✗ FAIL"
-        print(f"{status} - {name}")
-
-    print(f"\nTotal: {passed}/{total} tests passed")
-
-    if passed == total:
-        print("\n🎉 All tests passed!")
-        return 0
-    else:
-        print(f"\n⚠️  {total - passed} test(s) failed")
-        return 1
+    config = MockConfig()
+    tool_manager = BuiltinToolManager(config, ollama_host="http://localhost:11434")
 
+    # Check handlers exist
+    missing = set(expected_handlers) - set(dir(tool_manager))
+    assert not missing, f"Missing handlers: {sorted(missing)}"
 
-if __name__ == "__main__":
-    sys.exit(main())
+    print(f"✓ All 4 artifact tool handlers registered")
+    for handler in expected_handlers:
+        print(f"  - {handler}")
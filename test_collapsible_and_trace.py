@@ -1,12 +1,17 @@
-#!/usr/bin/env python3
 """
 Test script for collapsible output and trace logging features.
 """
 
+import io
+
+import pytest
 from rich.console import Console
 from mcp_client_for_ollama.utils.collapsible_output import CollapsibleOutput, TaskOutputCollector
 from mcp_client_for_ollama.utils.trace_logger import TraceLogger, TraceLoggerFactory, TraceLevel
 
+# Non-interactive console shared by all tests; skips terminal detection
+_CONSOLE = Console(file=io.StringIO(), force_terminal=False, color_system=None, width=80)
+
 
 def test_collapsible_output():
     """Test the collapsible output functionality."""
@@ -14,9 +19,8 @@ def test_collapsible_output():
     print("Testing Collapsible Output")
     print("=" * 60)
 
-    console = Console()
     collapsible = CollapsibleOutput(
-        console=console,
+        console=_CONSOLE,
         line_threshold=5,
         char_threshold=100,
         auto_collapse=True
@@ -33,7 +37,7 @@ def test_collapsible_output():
 
     # Test 2: Long output (should collapse)
     print("\n2. Long output (should collapse):")
-    long_output = "\n".join([f"Line {i}: This is a longer response with many lines" for i in range(20)])
+    long_output = "\n".join(f"Line {i}: This is a longer response with many lines" for i in range(20))
     collapsible.print_with_preview(
         content=long_output,
         title="Task 2 Result",
@@ -52,91 +56,85 @@ def test_collapsible_output():
 
     # Test 4: Task output collector
     print("\n4. Task output collector:")
-    task_output = TaskOutputCollector(console, collapsible)
+    task_output = TaskOutputCollector(_CONSOLE, collapsible)
     task_output.print_task_result(
         task_id="task_4",
         agent_type="READER",
         description="Read and analyze a large configuration file",
-        result="\n".join([f"Config line {i}: value_{i}" for i in range(30)]),
+        result="\n".join(f"Config line {i}: value_{i}" for i in range(30)),
         status="completed"
     )
 
     print("\n✅ Collapsible output tests completed!\n")
 
 
-def test_trace_logging():
-    """Test the trace logging functionality."""
-    print("=" * 60)
-    print("Testing Trace Logging")
-    print("=" * 60)
+TRACE_LEVELS = [TraceLevel.OFF, TraceLevel.SUMMARY, TraceLevel.BASIC, TraceLevel.FULL]
 
-    console = Console()
 
-    # Test different trace levels
-    for level in [TraceLevel.OFF, TraceLevel.SUMMARY, TraceLevel.BASIC, TraceLevel.FULL]:
-        print(f"\n--- Testing TraceLevel.{level.name} ---")
+@pytest.mark.parametrize("level", TRACE_LEVELS, ids=lambda level: level.name)
+def test_trace_logging(level, tmp_path):
+    """Test the trace logging functionality at one trace level."""
+    print(f"\n--- Testing TraceLevel.{level.name} ---")
 
-        logger = TraceLogger(
-            level=level,
-            log_dir=".trace_test",
-            console_output=False
-        )
+    logger = TraceLogger(
+        level=level,
+        log_dir=str(tmp_path),
+        console_output=False
+    )
 
-        if level == TraceLevel.OFF:
-            assert not logger.is_enabled()
-            print(f"✓ {level.name}: Tracing disabled")
-            continue
+    if level == TraceLevel.OFF:
+        assert not logger.is_enabled()
+        print(f"✓ {level.name}: Tracing disabled")
+        return
 
-        assert logger.is_enabled()
+    assert logger.is_enabled()
 
-        # Log some events
-        logger.log_task_start(
-            task_id="test_task_1",
-            agent_type="READER",
-            description="Test task description",
-            dependencies=[]
-        )
+    # Log some events
+    logger.log_task_start(
+        task_id="test_task_1",
+        agent_type="READER",
+        description="Test task description",
+        dependencies=[]
+    )
 
-        logger.log_llm_call(
-            task_id="test_task_1",
-            agent_type="READER",
-            prompt="Test prompt for reading a file",
-            response="Test response with file contents",
-            model="qwen2.5:7b",
-            temperature=0.5,
-            loop_iteration=0,
-            tools_used=["builtin.read_file"]
-        )
+    logger.log_llm_call(
+        task_id="test_task_1",
+        agent_type="READER",
+        prompt="Test prompt for reading a file",
+        response="Test response with file contents",
+        model="qwen2.5:7b",
+        temperature=0.5,
+        loop_iteration=0,
+        tools_used=["builtin.read_file"]
+    )
 
-        if level in [TraceLevel.FULL, TraceLevel.DEBUG]:
-            logger.log_tool_call(
-                task_id="test_task_1",
-                agent_type="READER",
-                tool_name="builtin.read_file",
-                arguments={"path": "/test/file.txt"},
-                result="File contents here...",
-                success=True
-            )
-
-        logger.log_task_end(
+    if level in [TraceLevel.FULL, TraceLevel.DEBUG]:
+        logger.log_tool_call(
             task_id="test_task_1",
             agent_type="READER",
-            status="completed",
-            result="Task completed successfully",
-            duration_ms=1234.56
+            tool_name="builtin.read_file",
+            arguments={"path": "/test/file.txt"},
+            result="File contents here...",
+            success=True
         )
 
-        # Get summary
-        summary = logger.get_summary()
-        print(f"✓ {level.name}: Logged {summary['total_entries']} entries")
-        print(f"  - LLM calls: {summary['llm_calls']}")
-        print(f"  - Tool calls: {summary['tool_calls']}")
-        print(f"  - Log file: {summary['log_file']}")
+    logger.log_task_end(
+        task_id="test_task_1",
+        agent_type="READER",
+        status="completed",
+        result="Task completed successfully",
+        duration_ms=1234.56
+    )
 
-    print("\n✅ Trace logging tests completed!\n")
+    # Get summary
+    summary = logger.get_summary()
+    print(f"✓ {level.name}: Logged {summary['total_entries']} entries")
+    print(f"  - LLM calls: {summary['llm_calls']}")
+    print(f"  - Tool calls: {summary['tool_calls']}")
+    print(f"  - Log file: {summary['log_file']}")
 
 
-def test_factory_config():
+def test_factory_config(tmp_path):
     """Test the trace logger factory with config."""
     print("=" * 60)
     print("Testing TraceLoggerFactory")
@@ -152,7 +150,7 @@ def test_factory_config():
     config2 = {
         "trace_enabled": True,
         "trace_level": "basic",
-        "trace_dir": ".trace_test"
+        "trace_dir": str(tmp_path)
     }
     logger2 = TraceLoggerFactory.from_config(config2)
     assert logger2.is_enabled()
@@ -163,7 +161,7 @@ def test_factory_config():
     config3 = {
         "trace_enabled": True,
         "trace_level": "full",
-        "trace_dir": ".trace_test",
+        "trace_dir": str(tmp_path),
         "trace_console": True,
         "trace_truncate": 1000
     }
@@ -176,16 +174,15 @@ def test_factory_config():
     print("\n✅ Factory configuration tests completed!\n")
 
 
-def test_trace_summary():
+def test_trace_summary(tmp_path):
     """Test the trace summary output."""
     print("=" * 60)
     print("Testing Trace Summary Output")
     print("=" * 60)
 
-    console = Console()
     logger = TraceLogger(
         level=TraceLevel.FULL,
-        log_dir=".trace_test"
+        log_dir=str(tmp_path)
     )
 
     # Simulate a delegation session
@@ -196,51 +193,27 @@ def test_trace_summary():
         examples_used=["code-modification"]
     )
 
+    events = []
     for i in range(3):
         task_id = f"task_{i+1}"
-        logger.log_task_start(task_id, "READER", f"Task {i+1}", [])
-        logger.log_llm_call(task_id, "READER", "prompt", "response", "model", 0.5, 0)
-        logger.log_task_end(task_id, "READER", "completed", "result", duration_ms=100.0)
+        events.extend([
+            ("task_start", {"task_id": task_id, "agent_type": "READER",
+                            "description": f"Task {i+1}", "dependencies": []}),
+            ("llm_call", {"task_id": task_id, "agent_type": "READER", "prompt": "prompt",
+                          "response": "response", "model": "model", "temperature": 0.5}),
+            ("task_end", {"task_id": task_id, "agent_type": "READER", "status": "completed",
+                          "result": "result", "duration_ms": 100.0}),
+        ])
+    logger.log_events(events)
 
     # Print summary
-    logger.print_summary(console)
+    logger.print_summary(_CONSOLE)
 
     summary = logger.get_summary()
     assert summary['tasks_completed'] == 3
     assert summary['llm_calls'] == 3
-    print("\n✅ Trace summary tests completed!\n")
-
-
-def main():
-    """Run all tests."""
-    print("\n🧪 Testing Collapsible Output and Trace Logging Features\n")
 
-    try:
-        test_collapsible_output()
-        test_trace_logging()
-        test_factory_config()
-        test_trace_summary()
-
-        print("=" * 60)
-        print("🎉 All tests passed successfully!")
-        print("=" * 60)
-
-        # Cleanup
-        import shutil
-        import os
-        if os.path.exists(".trace_test"):
-            shutil.rmtree(".trace_test")
-            print("\n🧹 Cleaned up test trace directory")
-
-    except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-
-    return 0
-
-
-if __name__ == "__main__":
-    import sys
-    sys.exit(main())
+    # The batch reaches the log file along with the planning entry
+    with open(logger.log_file) as f:
+        assert len(f.readlines()) == 10
+    print("\n✅ Trace summary tests completed!\n")
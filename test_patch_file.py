@@ -1,50 +1,15 @@
-#!/usr/bin/env python3
 """
-Test script for the new builtin.patch_file tool.
+Tests for the builtin.patch_file tool.
 
-This script demonstrates and verifies the patch_file functionality.
+These tests demonstrate and verify the patch_file functionality.
 """
 
-import os
-import sys
-import tempfile
-from pathlib import Path
-
-# Add parent directory to path to import the module
-sys.path.insert(0, str(Path(__file__).parent))
+import pytest
 
 from mcp_client_for_ollama.tools.builtin import BuiltinToolManager
 
 
-class MockModelConfigManager:
-    """Mock config manager for testing."""
-    def __init__(self):
-        self.system_prompt = "Test prompt"
-
-    def get_system_prompt(self):
-        return self.system_prompt
-
-
-def test_patch_file():
-    """Test the patch_file tool functionality."""
-
-    # Create a temporary directory for testing
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Change to temp directory
-        original_cwd = os.getcwd()
-        os.chdir(tmpdir)
-
-        try:
-            # Initialize the builtin tool manager
-            config_manager = MockModelConfigManager()
-            tool_manager = BuiltinToolManager(config_manager)
-
-            # Test 1: Create a test file
-            print("=" * 60)
-            print("TEST 1: Creating test file")
-            print("=" * 60)
-
-            test_content = """# Configuration File
+CONFIG_CONTENT = """# Configuration File
 DEBUG = True
 MAX_CONNECTIONS = 10
 TIMEOUT = 30
@@ -56,102 +21,7 @@ def handle_error():
     return "error"
 """
 
-            result = tool_manager.execute_tool("write_file", {
-                "path": "config.py",
-                "content": test_content
-            })
-            print(result)
-            print()
-
-            # Test 2: Simple single replacement
-            print("=" * 60)
-            print("TEST 2: Simple single replacement")
-            print("=" * 60)
-
-            result = tool_manager.execute_tool("patch_file", {
-                "path": "config.py",
-                "changes": [
-                    {
-                        "search": "DEBUG = True",
-                        "replace": "DEBUG = False"
-                    }
-                ]
-            })
-            print(result)
-            print()
-
-            # Test 3: Multiple changes in one operation
-            print("=" * 60)
-            print("TEST 3: Multiple changes in one operation")
-            print("=" * 60)
-
-            result = tool_manager.execute_tool("patch_file", {
-                "path": "config.py",
-                "changes": [
-                    {
-                        "search": "MAX_CONNECTIONS = 10",
-                        "replace": "MAX_CONNECTIONS = 100"
-                    },
-                    {
-                        "search": "TIMEOUT = 30",
-                        "replace": "TIMEOUT = 60"
-                    }
-                ]
-            })
-            print(result)
-            print()
-
-            # Test 4: Multi-line replacement
-            print("=" * 60)
-            print("TEST 4: Multi-line replacement")
-            print("=" * 60)
-
-            result = tool_manager.execute_tool("patch_file", {
-                "path": "config.py",
-                "changes": [
-                    {
-                        "search": "def process_request():\n    return \"processing\"",
-                        "replace": "def process_request():\n    # Enhanced processing\n    return \"processing_v2\""
-                    }
-                ]
-            })
-            print(result)
-            print()
-
-            # Test 5: Read the final file to verify
-            print("=" * 60)
-            print("TEST 5: Final file contents")
-            print("=" * 60)
-
-            result = tool_manager.execute_tool("read_file", {
-                "path": "config.py"
-            })
-            print(result)
-            print()
-
-            # Test 6: Error case - search text not found
-            print("=" * 60)
-            print("TEST 6: Error case - search text not found")
-            print("=" * 60)
-
-            result = tool_manager.execute_tool("patch_file", {
-                "path": "config.py",
-                "changes": [
-                    {
-                        "search": "NONEXISTENT = True",
-                        "replace": "NONEXISTENT = False"
-                    }
-                ]
-            })
-            print(result)
-            print()
-
-            # Test 7: Create file with duplicate text
-            print("=" * 60)
-            print("TEST 7: Handling duplicate text with occurrence")
-            print("=" * 60)
-
-            duplicate_content = """def test():
+DUPLICATE_CONTENT = """def test():
     assert result == expected
 
 def test2():
@@ -161,73 +31,154 @@ def test3():
     assert result == expected
 """
 
-            tool_manager.execute_tool("write_file", {
-                "path": "test_duplicates.py",
-                "content": duplicate_content
-            })
-
-            # Try without occurrence (should error)
-            print("Attempting without occurrence (should error):")
-            result = tool_manager.execute_tool("patch_file", {
-                "path": "test_duplicates.py",
-                "changes": [
-                    {
-                        "search": "assert result == expected",
-                        "replace": "assert result == expected, 'mismatch'"
-                    }
-                ]
-            })
-            print(result)
-            print()
-
-            # Try with occurrence specified (should succeed)
-            print("Attempting with occurrence=2 (should succeed):")
-            result = tool_manager.execute_tool("patch_file", {
-                "path": "test_duplicates.py",
-                "changes": [
-                    {
-                        "search": "assert result == expected",
-                        "replace": "assert result == expected, 'mismatch'",
-                        "occurrence": 2
-                    }
-                ]
-            })
-            print(result)
-            print()
-
-            # Verify the change
-            result = tool_manager.execute_tool("read_file", {
-                "path": "test_duplicates.py"
-            })
-            print("File after occurrence-based replacement:")
-            print(result)
-            print()
-
-            # Test 8: Verify tool is in available tools
-            print("=" * 60)
-            print("TEST 8: Verify tool is in available tools list")
-            print("=" * 60)
-
-            tools = tool_manager.get_builtin_tools()
-            patch_tool = next((t for t in tools if t.name == "builtin.patch_file"), None)
-
-            if patch_tool:
-                print(f"✓ Tool found: {patch_tool.name}")
-                print(f"  Description: {patch_tool.description[:100]}...")
-                print(f"  Has inputSchema: {bool(patch_tool.inputSchema)}")
-                print()
-            else:
-                print("✗ Tool NOT found in available tools!")
-                print()
-
-            print("=" * 60)
-            print("ALL TESTS COMPLETED SUCCESSFULLY!")
-            print("=" * 60)
-
-        finally:
-            # Restore original working directory
-            os.chdir(original_cwd)
-
-
-if __name__ == "__main__":
-    test_patch_file()
+
+class MockModelConfigManager:
+    """Mock config manager for testing."""
+    def __init__(self):
+        self.system_prompt = "Test prompt"
+
+    def get_system_prompt(self):
+        return self.system_prompt
+
+
+@pytest.fixture(scope="module")
+def tool_manager():
+    """BuiltinToolManager shared by this module; built once."""
+    return BuiltinToolManager(MockModelConfigManager())
+
+
+@pytest.fixture
+def workdir(tool_manager, tmp_path):
+    """Point the shared manager at a fresh directory for each test."""
+    tool_manager.working_directory = str(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def config_file(tool_manager, workdir):
+    """Write the sample config file through the tool."""
+    result = tool_manager.execute_tool("write_file", {
+        "path": "config.py",
+        "content": CONFIG_CONTENT
+    })
+    assert "written successfully" in result
+    return workdir / "config.py"
+
+
+def test_single_replacement(tool_manager, config_file):
+    """A unique search text is replaced."""
+    result = tool_manager.execute_tool("patch_file", {
+        "path": "config.py",
+        "changes": [
+            {
+                "search": "DEBUG = True",
+                "replace": "DEBUG = False"
+            }
+        ]
+    })
+
+    assert "patched successfully" in result
+    assert "DEBUG = False" in config_file.read_text()
+
+
+def test_multiple_changes(tool_manager, config_file):
+    """Several changes are applied in one operation."""
+    result = tool_manager.execute_tool("patch_file", {
+        "path": "config.py",
+        "changes": [
+            {
+                "search": "MAX_CONNECTIONS = 10",
+                "replace": "MAX_CONNECTIONS = 100"
+            },
+            {
+                "search": "TIMEOUT = 30",
+                "replace": "TIMEOUT = 60"
+            }
+        ]
+    })
+
+    assert "Applied 2 changes" in result
+    content = config_file.read_text()
+    assert "MAX_CONNECTIONS = 100" in content
+    assert "TIMEOUT = 60" in content
+
+
+def test_multiline_replacement(tool_manager, config_file):
+    """Search and replace texts may span several lines."""
+    result = tool_manager.execute_tool("patch_file", {
+        "path": "config.py",
+        "changes": [
+            {
+                "search": "def process_request():\n    return \"processing\"",
+                "replace": "def process_request():\n    # Enhanced processing\n    return \"processing_v2\""
+            }
+        ]
+    })
+
+    assert "patched successfully" in result
+    assert "Lines: 11 → 12 (+1)" in result
+
+    result = tool_manager.execute_tool("read_file", {"path": "config.py"})
+    assert "# Enhanced processing" in result
+    assert "processing_v2" in result
+
+
+def test_search_text_not_found(tool_manager, config_file):
+    """A missing search text is reported and the file is left unchanged."""
+    result = tool_manager.execute_tool("patch_file", {
+        "path": "config.py",
+        "changes": [
+            {
+                "search": "NONEXISTENT = True",
+                "replace": "NONEXISTENT = False"
+            }
+        ]
+    })
+
+    assert "search text not found" in result
+    assert config_file.read_text() == CONFIG_CONTENT
+
+
+def test_duplicate_text_requires_occurrence(tool_manager, workdir):
+    """Repeated search text must name an occurrence; the named one is replaced."""
+    tool_manager.execute_tool("write_file", {
+        "path": "test_duplicates.py",
+        "content": DUPLICATE_CONTENT
+    })
+
+    result = tool_manager.execute_tool("patch_file", {
+        "path": "test_duplicates.py",
+        "changes": [
+            {
+                "search": "assert result == expected",
+                "replace": "assert result == expected, 'mismatch'"
+            }
+        ]
+    })
+    assert "appears 3 times" in result
+
+    result = tool_manager.execute_tool("patch_file", {
+        "path": "test_duplicates.py",
+        "changes": [
+            {
+                "search": "assert result == expected",
+                "replace": "assert result == expected, 'mismatch'",
+                "occurrence": 2
+            }
+        ]
+    })
+    assert "Replaced occurrence 2 of 3" in result
+
+    lines = (workdir / "test_duplicates.py").read_text().splitlines()
+    assert lines[1] == "    assert result == expected"
+    assert lines[4] == "    assert result == expected, 'mismatch'"
+    assert lines[7] == "    assert result == expected"
+
+
+def test_tool_is_available(tool_manager):
+    """patch_file is listed among the builtin tools."""
+    patch_tool = tool_manager.get_builtin_tool("builtin.patch_file")
+
+    assert patch_tool is not None
+    assert patch_tool.description
+    assert patch_tool.inputSchema
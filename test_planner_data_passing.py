@@ -8,16 +8,16 @@ This test checks that:
 3. A simulated plan correctly includes the data
 """
 
-import json
 from pathlib import Path
 
+from mcp_client_for_ollama.agents._json_cache import load_json
+
 
 def test_planner_prompt_has_data_guidance():
     """Test that planner.json has guidance about including data in task descriptions."""
     planner_path = Path("mcp_client_for_ollama/agents/definitions/planner.json")
 
-    with open(planner_path) as f:
-        planner_config = json.load(f)
+    planner_config = load_json(planner_path)
 
     system_prompt = planner_config.get("system_prompt", "")
 
@@ -28,10 +28,7 @@ def test_planner_prompt_has_data_guidance():
         "copy that content verbatim into the task description"
     ]
 
-    missing = []
-    for phrase in required_phrases:
-        if phrase not in system_prompt:
-            missing.append(phrase)
+    missing = [phrase for phrase in required_phrases if phrase not in system_prompt]
 
     if missing:
         print("❌ FAILED: Planner prompt missing data guidance:")
@@ -47,15 +44,11 @@ def test_example_shows_correct_pattern():
     """Test that the example demonstrates including data in task descriptions."""
     examples_path = Path("mcp_client_for_ollama/agents/examples/planner_examples.json")
 
-    with open(examples_path) as f:
-        examples_data = json.load(f)
+    examples_data = load_json(examples_path)
 
     # Find the mcp-tool-with-specific-data example
-    example = None
-    for ex in examples_data.get("examples", []):
-        if ex.get("category") == "mcp-tool-with-specific-data":
-            example = ex
-            break
+    example = next((ex for ex in examples_data.get("examples", [])
+                    if ex.get("category") == "mcp-tool-with-specific-data"), None)
 
     if not example:
         print("❌ FAILED: Could not find 'mcp-tool-with-specific-data' example")
@@ -75,10 +68,7 @@ def test_example_shows_correct_pattern():
         "Pinnacle freight"
     ]
 
-    missing_content = []
-    for content in required_content:
-        if content not in description:
-            missing_content.append(content)
+    missing_content = [content for content in required_content if content not in description]
 
     if missing_content:
         print("❌ FAILED: Task description missing actual data:")
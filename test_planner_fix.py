@@ -7,15 +7,16 @@ This test checks that:
 2. The validation logic properly rejects invalid agent types
 """
 
-import json
 from pathlib import Path
 
+from mcp_client_for_ollama.agents._json_cache import load_json
+
+
 def test_planner_prompt_has_guidance():
     """Test that planner.json has the updated system prompt with MCP tool guidance."""
     planner_path = Path("mcp_client_for_ollama/agents/definitions/planner.json")
 
-    with open(planner_path) as f:
-        planner_config = json.load(f)
+    planner_config = load_json(planner_path)
 
     system_prompt = planner_config.get("system_prompt", "")
 
@@ -26,10 +27,7 @@ def test_planner_prompt_has_guidance():
         "Instead, assign tasks to the appropriate agent"
     ]
 
-    missing = []
-    for phrase in required_phrases:
-        if phrase not in system_prompt:
-            missing.append(phrase)
+    missing = [phrase for phrase in required_phrases if phrase not in system_prompt]
 
     if missing:
         print("❌ FAILED: Planner prompt missing guidance:")
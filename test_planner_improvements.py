@@ -8,9 +8,12 @@ Tests:
 3. Plan quality validation
 """
 
-import json
 from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mcp_client_for_ollama.agents._json_cache import load_json
 from mcp_client_for_ollama.agents.agent_config import AgentConfig
+from mcp_client_for_ollama.agents.delegation_client import DelegationClient
 
 
 def test_agent_discovery():
@@ -52,8 +55,7 @@ def test_example_loading():
         print(f"❌ Examples file not found: {examples_path}")
         return False
 
-    with open(examples_path, 'r') as f:
-        data = json.load(f)
+    data = load_json(examples_path)
 
     examples = data.get('examples', [])
     print(f"✅ Loaded {len(examples)} examples")
@@ -75,68 +77,58 @@ def test_example_loading():
     return len(examples) >= 10
 
 
+# One example per category, in this order; ties between categories are
+# broken by example order
+_SELECTION_CATEGORIES = [
+    'simple-read', 'simple-execute', 'multi-file-read', 'code-modification',
+    'debugging', 'refactoring', 'note-taking', 'music-creation',
+    'analysis-with-execution', 'bug-investigation',
+]
+
+
+def _make_delegation_client(examples):
+    """DelegationClient on a mocked MCP client, using the given planner examples."""
+    mcp_client = MagicMock()
+    mcp_client.host = "http://localhost:11434"
+    mcp_client.model_manager.get_current_model.return_value = "test-model"
+
+    with patch('mcp_client_for_ollama.agents.delegation_client.AgentConfig.load_all_definitions',
+               return_value={}):
+        client = DelegationClient(mcp_client, {})
+    client.planner_examples = examples
+    return client
+
+
 def test_example_selection():
-    """Test example selection algorithm with various queries."""
+    """Test DelegationClient._select_relevant_examples with various queries."""
     print("🎯 Testing Example Selection Algorithm...")
 
-    # Mock DelegationClient's example selection logic
-    examples_path = Path("mcp_client_for_ollama/agents/examples/planner_examples.json")
-    with open(examples_path, 'r') as f:
-        data = json.load(f)
-    examples = data.get('examples', [])
+    examples = [{'category': category, 'query': f"{category} example"}
+                for category in _SELECTION_CATEGORIES]
+    client = _make_delegation_client(examples)
 
     test_queries = [
-        ("Fix the authentication bug", ['debugging', 'bug-investigation']),
-        ("Read all markdown files in docs/", ['multi-file-read']),
+        ("Fix the authentication bug", ['debugging']),
+        ("Read all markdown files in docs/", ['multi-file-read', 'simple-read']),
         ("Write a sad song about breakups", ['music-creation']),
-        ("Refactor the user service", ['refactoring', 'code-modification']),
-        ("Create an Obsidian note", ['note-taking']),
+        ("Refactor the user service", ['refactoring']),
+        ("Create an Obsidian note", ['note-taking', 'code-modification']),
         ("Profile the application", ['analysis-with-execution']),
+        # Keywords match inside words: 'files' in 'profiles'
+        ("Clean up user profiles", ['multi-file-read', 'refactoring']),
+        ("Investigate the failure", ['bug-investigation', 'debugging']),
+        # A keyword inside a query word outranks a phrase spanning words
+        ("What is in the obsidian vault", ['note-taking', 'simple-read']),
+        # No keyword matches: fall back to the simple examples
+        ("Hello there", ['simple-read', 'simple-execute']),
     ]
 
-    category_keywords = {
-        'multi-file-read': ['read', 'scan', 'list', 'show', 'summarize', 'files', 'all'],
-        'code-modification': ['add', 'modify', 'update', 'change', 'implement', 'create'],
-        'debugging': ['fix', 'bug', 'error', 'issue', 'broken', 'debug', 'investigate'],
-        'refactoring': ['refactor', 'restructure', 'reorganize', 'clean', 'improve'],
-        'testing': ['test', 'verify', 'check', 'validate', 'coverage'],
-        'music-creation': ['song', 'lyrics', 'music', 'suno', 'write song'],
-        'note-taking': ['obsidian', 'note', 'markdown note', 'create note'],
-        'analysis-with-execution': ['profile', 'benchmark', 'performance', 'analyze'],
-        'bug-investigation': ['investigate', 'debug', 'error', '500', 'failure'],
-    }
-
-    def select_examples(query, max_examples=2):
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
-        scored_examples = []
-
-        for example in examples:
-            score = 0
-            category = example.get('category', '')
-
-            if category in query_lower:
-                score += 10
-
-            keywords = category_keywords.get(category, [])
-            for keyword in keywords:
-                if keyword in query_lower:
-                    score += 2
-                if any(keyword in word for word in query_words):
-                    score += 1
-
-            scored_examples.append((score, example))
-
-        scored_examples.sort(reverse=True, key=lambda x: x[0])
-        return [ex for score, ex in scored_examples if score > 0][:max_examples]
-
-    all_passed = True
+    failures = []
     for query, expected_categories in test_queries:
-        selected = select_examples(query, max_examples=2)
+        selected = client._select_relevant_examples(query, max_examples=2)
         selected_cats = [ex['category'] for ex in selected]
 
-        # Check if any expected category is in the selection
-        match = any(cat in selected_cats for cat in expected_categories)
+        match = selected_cats == expected_categories
         status = "✅" if match else "❌"
 
         print(f"{status} Query: '{query}'")
@@ -144,10 +136,11 @@ def test_example_selection():
         print(f"   Selected: {selected_cats}")
 
         if not match:
-            all_passed = False
+            failures.append(query)
 
     print()
-    return all_passed
+    assert not failures, f"Unexpected example selection for: {failures}"
+    return True
 
 
 def test_plan_validation():
@@ -0,0 +1,105 @@
+"""Shared fixtures for memory tests."""
+
+import dataclasses
+import uuid
+from datetime import datetime
+
+import pytest
+
+from mcp_client_for_ollama.memory.base_memory import (
+    DomainMemory,
+    Feature,
+    FeatureStatus,
+    Goal,
+    MemoryMetadata,
+    OutcomeType,
+)
+
+_STATUSES = (
+    FeatureStatus.PENDING,
+    FeatureStatus.IN_PROGRESS,
+    FeatureStatus.COMPLETED,
+    FeatureStatus.FAILED,
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --benchmark-enable is passed."""
+    if config.getoption("benchmark_enable", False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with --benchmark-enable")
+    for item in items:
+        if "benchmark" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def metadata_template():
+    """Metadata built once per session with a fixed timestamp."""
+    timestamp = datetime(2024, 1, 1)
+    return MemoryMetadata(
+        session_id="test",
+        domain="coding",
+        description="Test",
+        created_at=timestamp,
+        updated_at=timestamp,
+    )
+
+
+@pytest.fixture(scope="session")
+def make_memory(metadata_template):
+    """Factory for an empty DomainMemory; keyword args override metadata fields."""
+    def _make(**overrides):
+        return DomainMemory(metadata=dataclasses.replace(metadata_template, **overrides))
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_large_memory(make_memory):
+    """Factory for a memory with n_goals goals of n_feat features each.
+
+    Feature statuses cycle through pending/in progress/completed/failed. With
+    with_progress=True every feature also gets one progress entry.
+    """
+    def _make(n_goals, n_feat, with_progress=False):
+        memory = make_memory()
+        memory.goals = [
+            Goal(
+                id=f"G{g}",
+                description=f"Goal {g}",
+                features=[
+                    Feature(
+                        id=f"F{g}.{f}",
+                        description=f"Feature {f} of goal {g}",
+                        status=_STATUSES[f % len(_STATUSES)],
+                        criteria=["Works", "Is tested"],
+                        tests=[f"test_{g}_{f}"],
+                    )
+                    for f in range(n_feat)
+                ],
+            )
+            for g in range(n_goals)
+        ]
+        if with_progress:
+            for feature in memory.get_all_features():
+                memory.add_progress_entry(
+                    agent_type="CODER",
+                    action=f"Worked on {feature.id}",
+                    outcome=OutcomeType.SUCCESS,
+                    details="Benchmark entry",
+                    feature_id=feature.id,
+                )
+        return memory
+    return _make
+
+
+@pytest.fixture(scope="session")
+def memory_tmp_root(tmp_path_factory):
+    """One base directory for all storage tests; pytest's retention policy cleans it."""
+    return tmp_path_factory.mktemp("memstore")
+
+
+@pytest.fixture
+def temp_storage_dir(memory_tmp_root):
+    """Fresh, not yet created storage directory under the session root."""
+    return memory_tmp_root / uuid.uuid4().hex
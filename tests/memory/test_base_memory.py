@@ -1,19 +1,22 @@
 """Tests for base memory dataclasses."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from mcp_client_for_ollama.memory.base_memory import (
     DomainMemory,
     Goal,
     Feature,
     ProgressEntry,
     TestResult,
-    MemoryMetadata,
     FeatureStatus,
     GoalStatus,
     OutcomeType,
 )
 
+# Fixed timestamp so payloads are deterministic and built once
+_NOW = datetime(2024, 1, 1)
+_NOW_ISO = _NOW.isoformat()
+
 
 class TestFeature:
     """Tests for Feature class."""
@@ -57,8 +60,8 @@ class TestFeature:
             "tests": ["test_1"],
             "test_results": [],
             "notes": "",
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO,
             "assigned_to": None,
         }
         feature = Feature.from_dict(data)
@@ -66,39 +69,23 @@ class TestFeature:
         assert feature.id == "F1"
         assert feature.description == "Test feature"
         assert feature.status == FeatureStatus.PENDING
-
-    def test_update_status_from_tests_all_pass(self):
-        """Test status update when all tests pass."""
-        feature = Feature(id="F1", description="Test")
-        feature.test_results = [
-            TestResult("test_1", "F1", True, datetime.now()),
-            TestResult("test_2", "F1", True, datetime.now()),
-        ]
-        feature.update_status_from_tests()
-
-        assert feature.status == FeatureStatus.COMPLETED
-
-    def test_update_status_from_tests_all_fail(self):
-        """Test status update when all tests fail."""
-        feature = Feature(id="F1", description="Test")
-        feature.test_results = [
-            TestResult("test_1", "F1", False, datetime.now()),
-            TestResult("test_2", "F1", False, datetime.now()),
-        ]
-        feature.update_status_from_tests()
-
-        assert feature.status == FeatureStatus.FAILED
-
-    def test_update_status_from_tests_partial(self):
-        """Test status update when some tests pass."""
+        assert feature.created_at == _NOW
+
+    @pytest.mark.parametrize("passed,expected", [
+        ([True, True], FeatureStatus.COMPLETED),
+        ([False, False], FeatureStatus.FAILED),
+        ([True, False], FeatureStatus.IN_PROGRESS),
+    ], ids=["all_pass", "all_fail", "partial"])
+    def test_update_status_from_tests(self, passed, expected):
+        """Test status update from the pass/fail pattern of test results."""
         feature = Feature(id="F1", description="Test")
         feature.test_results = [
-            TestResult("test_1", "F1", True, datetime.now()),
-            TestResult("test_2", "F1", False, datetime.now()),
+            TestResult(f"test_{i}", "F1", result, _NOW)
+            for i, result in enumerate(passed, 1)
         ]
         feature.update_status_from_tests()
 
-        assert feature.status == FeatureStatus.IN_PROGRESS
+        assert feature.status == expected
 
 
 class TestGoal:
@@ -137,46 +124,30 @@ class TestGoal:
             "features": [],
             "status": "pending",
             "constraints": [],
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO,
         }
         goal = Goal.from_dict(data)
 
         assert goal.id == "G1"
         assert goal.status == GoalStatus.PENDING
-
-    def test_update_status_all_completed(self):
-        """Test goal status when all features completed."""
-        goal = Goal(id="G1", description="Test")
-        goal.features = [
-            Feature(id="F1", description="F1", status=FeatureStatus.COMPLETED),
-            Feature(id="F2", description="F2", status=FeatureStatus.COMPLETED),
-        ]
-        goal.update_status_from_features()
-
-        assert goal.status == GoalStatus.COMPLETED
-
-    def test_update_status_all_failed(self):
-        """Test goal status when all features failed."""
-        goal = Goal(id="G1", description="Test")
-        goal.features = [
-            Feature(id="F1", description="F1", status=FeatureStatus.FAILED),
-            Feature(id="F2", description="F2", status=FeatureStatus.FAILED),
-        ]
-        goal.update_status_from_features()
-
-        assert goal.status == GoalStatus.FAILED
-
-    def test_update_status_in_progress(self):
-        """Test goal status when some features in progress."""
+        assert goal.created_at == _NOW
+
+    @pytest.mark.parametrize("statuses,expected", [
+        ([FeatureStatus.COMPLETED, FeatureStatus.COMPLETED], GoalStatus.COMPLETED),
+        ([FeatureStatus.FAILED, FeatureStatus.FAILED], GoalStatus.FAILED),
+        ([FeatureStatus.COMPLETED, FeatureStatus.IN_PROGRESS], GoalStatus.IN_PROGRESS),
+    ], ids=["all_completed", "all_failed", "in_progress"])
+    def test_update_status_from_features(self, statuses, expected):
+        """Test goal status derived from its features' statuses."""
         goal = Goal(id="G1", description="Test")
         goal.features = [
-            Feature(id="F1", description="F1", status=FeatureStatus.COMPLETED),
-            Feature(id="F2", description="F2", status=FeatureStatus.IN_PROGRESS),
+            Feature(id=f"F{i}", description=f"F{i}", status=status)
+            for i, status in enumerate(statuses, 1)
         ]
         goal.update_status_from_features()
 
-        assert goal.status == GoalStatus.IN_PROGRESS
+        assert goal.status == expected
 
     def test_get_next_feature(self):
         """Test getting next feature to work on."""
@@ -198,7 +169,7 @@ class TestProgressEntry:
     def test_create_progress_entry(self):
         """Test creating a progress entry."""
         entry = ProgressEntry(
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             agent_type="CODER",
             action="Implemented feature",
             outcome=OutcomeType.SUCCESS,
@@ -210,7 +181,7 @@ class TestProgressEntry:
     def test_progress_entry_to_log_line(self):
         """Test formatting as log line."""
         entry = ProgressEntry(
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             agent_type="CODER",
             action="Implemented feature",
             outcome=OutcomeType.SUCCESS,
@@ -227,32 +198,18 @@ class TestProgressEntry:
 class TestDomainMemory:
     """Tests for DomainMemory class."""
 
-    def test_create_domain_memory(self):
+    def test_create_domain_memory(self, make_memory):
         """Test creating domain memory."""
-        metadata = MemoryMetadata(
-            session_id="test_session",
-            domain="coding",
-            description="Test session",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory(session_id="test_session", description="Test session")
 
         assert memory.metadata.session_id == "test_session"
         assert memory.metadata.domain == "coding"
         assert memory.goals == []
         assert memory.progress_log == []
 
-    def test_add_progress_entry(self):
+    def test_add_progress_entry(self, make_memory):
         """Test adding progress entry."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
 
         memory.add_progress_entry(
             agent_type="CODER",
@@ -264,41 +221,30 @@ class TestDomainMemory:
         assert len(memory.progress_log) == 1
         assert memory.progress_log[0].agent_type == "CODER"
 
-    def test_get_recent_progress(self):
+    def test_get_recent_progress(self, make_memory):
         """Test getting recent progress."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
 
-        # Add multiple entries
-        for i in range(15):
-            memory.add_progress_entry(
+        # Distinct, increasing timestamps so the ordering doesn't depend on the clock
+        memory.progress_log = [
+            ProgressEntry(
+                timestamp=_NOW + timedelta(seconds=i),
                 agent_type="CODER",
                 action=f"Action {i}",
                 outcome=OutcomeType.SUCCESS,
                 details=f"Details {i}",
             )
+            for i in range(15)
+        ]
 
         recent = memory.get_recent_progress(limit=5)
         assert len(recent) == 5
         # Should be most recent first
         assert "14" in recent[0].action
 
-    def test_get_all_features(self):
+    def test_get_all_features(self, make_memory):
         """Test getting all features from all goals."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
 
         goal1 = Goal(id="G1", description="Goal 1")
         goal1.features = [
@@ -316,16 +262,9 @@ class TestDomainMemory:
         all_features = memory.get_all_features()
         assert len(all_features) == 3
 
-    def test_get_feature_by_id(self):
+    def test_get_feature_by_id(self, make_memory):
         """Test finding feature by ID."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
 
         goal = Goal(id="G1", description="Goal 1")
         goal.features = [
@@ -341,16 +280,9 @@ class TestDomainMemory:
         not_found = memory.get_feature_by_id("F99")
         assert not_found is None
 
-    def test_get_goal_by_id(self):
+    def test_get_goal_by_id(self, make_memory):
         """Test finding goal by ID."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
 
         goal1 = Goal(id="G1", description="Goal 1")
         goal2 = Goal(id="G2", description="Goal 2")
@@ -364,16 +296,9 @@ class TestDomainMemory:
         not_found = memory.get_goal_by_id("G99")
         assert not_found is None
 
-    def test_get_pending_features(self):
+    def test_get_pending_features(self, make_memory):
         """Test getting pending/failed features."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
 
         goal = Goal(id="G1", description="Goal 1")
         goal.features = [
@@ -387,16 +312,9 @@ class TestDomainMemory:
         assert len(pending) == 2
         assert all(f.status in [FeatureStatus.PENDING, FeatureStatus.FAILED] for f in pending)
 
-    def test_get_completion_percentage(self):
+    def test_get_completion_percentage(self, make_memory):
         """Test calculating completion percentage."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
 
         goal = Goal(id="G1", description="Goal 1")
         goal.features = [
@@ -410,16 +328,9 @@ class TestDomainMemory:
         percentage = memory.get_completion_percentage()
         assert percentage == 50.0
 
-    def test_memory_serialization(self):
+    def test_memory_serialization(self, make_memory):
         """Test full serialization/deserialization cycle."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test session",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory(description="Test session")
 
         goal = Goal(id="G1", description="Test goal")
         goal.features = [Feature(id="F1", description="Test feature")]
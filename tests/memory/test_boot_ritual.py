@@ -5,28 +5,43 @@ from datetime import datetime
 
 from mcp_client_for_ollama.memory.boot_ritual import BootRitual
 from mcp_client_for_ollama.memory.base_memory import (
-    DomainMemory,
     Goal,
     Feature,
-    MemoryMetadata,
     FeatureStatus,
     ProgressEntry,
     OutcomeType,
 )
 
+# Text the CODER context for sample_memory must contain: session info,
+# progress summary, goals and features, criteria, protocol and the task
+_REQUIRED_CONTEXT = (
+    "test_session",
+    "coding",
+    "Build authentication system",
+    "Total Features: 3",
+    "Completed:",
+    "Pending:",
+    "G1: User authentication",
+    "F1: Login endpoint",
+    "F2: Password hashing",
+    "F3: Token validation",
+    "Returns JWT on success",
+    "Uses bcrypt",
+    "PROTOCOL:",
+    "ONE feature at a time",
+    "Implement login endpoint",
+)
+
 
 class TestBootRitual:
     """Tests for BootRitual class."""
 
-    @pytest.fixture
-    def sample_memory(self):
-        """Create sample memory for testing."""
-        metadata = MemoryMetadata(
+    @pytest.fixture(scope="module")
+    def sample_memory(self, make_memory):
+        """Create sample memory for testing; shared by the module and only read."""
+        memory = make_memory(
             session_id="test_session",
-            domain="coding",
             description="Build authentication system",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
         )
 
         goal = Goal(id="G1", description="User authentication")
@@ -54,7 +69,7 @@ class TestBootRitual:
             ),
         ]
 
-        memory = DomainMemory(metadata=metadata, goals=[goal])
+        memory.goals = [goal]
 
         # Add some progress entries
         memory.add_progress_entry(
@@ -73,53 +88,24 @@ class TestBootRitual:
 
         return memory
 
-    def test_build_memory_context(self, sample_memory):
-        """Test building memory context for an agent."""
-        context = BootRitual.build_memory_context(
+    @pytest.fixture(scope="module")
+    def coder_context(self, sample_memory):
+        """CODER context for sample_memory, built once for the module."""
+        return BootRitual.build_memory_context(
             memory=sample_memory,
             agent_type="CODER",
             task_description="Implement login endpoint",
         )
 
-        # Check that context includes key information
-        assert "test_session" in context
-        assert "coding" in context
-        assert "Build authentication system" in context
-
-        # Check progress summary
-        assert "Total Features: 3" in context
-        assert "Completed:" in context
-        assert "Pending:" in context
-
-        # Check goals and features
-        assert "G1: User authentication" in context
-        assert "F1: Login endpoint" in context
-        assert "F2: Password hashing" in context
-        assert "F3: Token validation" in context
-
-        # Check criteria are included
-        assert "Returns JWT on success" in context
-        assert "Uses bcrypt" in context
-
-        # Check protocol
-        assert "PROTOCOL:" in context
-        assert "ONE feature at a time" in context
-
-        # Check task description is included
-        assert "Implement login endpoint" in context
+    def test_build_memory_context(self, coder_context):
+        """Test building memory context for an agent."""
+        missing = [text for text in _REQUIRED_CONTEXT if text not in coder_context]
+        assert not missing, missing
 
-    def test_build_memory_context_with_test_results(self):
+    def test_build_memory_context_with_test_results(self, make_memory):
         """Test context includes test result information."""
         from mcp_client_for_ollama.memory.base_memory import TestResult
 
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-
         feature = Feature(
             id="F1",
             description="Test feature",
@@ -131,7 +117,8 @@ class TestBootRitual:
         ]
 
         goal = Goal(id="G1", description="Test", features=[feature])
-        memory = DomainMemory(metadata=metadata, goals=[goal])
+        memory = make_memory()
+        memory.goals = [goal]
 
         context = BootRitual.build_memory_context(memory, "CODER")
 
@@ -149,36 +136,21 @@ class TestBootRitual:
         assert next_feature is not None
         assert next_feature.id == "F3"  # Failed has higher priority
 
-    def test_get_next_feature_suggestion_no_work(self):
+    def test_get_next_feature_suggestion_no_work(self, make_memory):
         """Test when no features need work."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-
         goal = Goal(id="G1", description="Test")
         goal.features = [
             Feature(id="F1", description="Done", status=FeatureStatus.COMPLETED),
         ]
 
-        memory = DomainMemory(metadata=metadata, goals=[goal])
+        memory = make_memory()
+        memory.goals = [goal]
 
         next_feature = BootRitual.get_next_feature_suggestion(memory, "CODER")
         assert next_feature is None
 
-    def test_get_next_feature_suggestion_priority(self):
+    def test_get_next_feature_suggestion_priority(self, make_memory):
         """Test priority-based feature selection."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-
         goal = Goal(id="G1", description="Test")
         goal.features = [
             Feature(id="F1", description="Low", notes="Priority: low", status=FeatureStatus.PENDING),
@@ -186,7 +158,8 @@ class TestBootRitual:
             Feature(id="F3", description="Medium", notes="Priority: medium", status=FeatureStatus.PENDING),
         ]
 
-        memory = DomainMemory(metadata=metadata, goals=[goal])
+        memory = make_memory()
+        memory.goals = [goal]
 
         next_feature = BootRitual.get_next_feature_suggestion(memory, "CODER")
 
@@ -219,17 +192,9 @@ class TestBootRitual:
         assert "update_feature_status" in message
         assert "log_progress" in message
 
-    def test_memory_context_includes_domain_state(self):
+    def test_memory_context_includes_domain_state(self, make_memory):
         """Test that domain state is included in context."""
-        metadata = MemoryMetadata(
-            session_id="test",
-            domain="coding",
-            description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-
-        memory = DomainMemory(metadata=metadata)
+        memory = make_memory()
         memory.state = {
             "test_harness": {
                 "framework": "pytest",
@@ -247,18 +212,14 @@ class TestBootRitual:
         assert "Language: python" in context
         assert "Git Enabled: True" in context
 
-    def test_memory_context_includes_recent_progress(self, sample_memory):
+    def test_memory_context_includes_recent_progress(self, coder_context):
         """Test that recent progress is included."""
-        context = BootRitual.build_memory_context(sample_memory, "CODER")
+        assert "RECENT PROGRESS:" in coder_context
+        assert "INITIALIZER" in coder_context
+        assert "CODER" in coder_context
+        assert "Implemented F2" in coder_context
 
-        assert "RECENT PROGRESS:" in context
-        assert "INITIALIZER" in context
-        assert "CODER" in context
-        assert "Implemented F2" in context
-
-    def test_memory_context_completion_percentage(self, sample_memory):
+    def test_memory_context_completion_percentage(self, coder_context):
         """Test completion percentage is shown."""
-        context = BootRitual.build_memory_context(sample_memory, "CODER")
-
         # 1 completed out of 3 = 33.3%
-        assert "Completion: 33.3%" in context
+        assert "Completion: 33.3%" in coder_context
@@ -0,0 +1,22 @@
+"""Benchmarks for BootRitual.build_memory_context as memory grows.
+
+Requires pytest-benchmark (in the dev dependency group). Skipped unless run
+with ``--benchmark-enable``, e.g.
+``pytest tests/memory/test_boot_ritual_perf.py --benchmark-enable``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from mcp_client_for_ollama.memory.boot_ritual import BootRitual
+
+
+@pytest.mark.parametrize("n_goals,n_feat", [(1, 5), (10, 10), (50, 20)])
+def test_build_context_perf(benchmark, make_large_memory, n_goals, n_feat):
+    """Time context building only; the memory is built outside the measured call."""
+    memory = make_large_memory(n_goals, n_feat)
+
+    context = benchmark(BootRitual.build_memory_context, memory, "CODER")
+
+    assert f"Total Features: {n_goals * n_feat}" in context
@@ -1,98 +1,99 @@
 """Tests for memory initializer."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
-
-from mcp_client_for_ollama.memory.initializer import (
-    MemoryInitializer,
-    InitializerPromptBuilder,
-)
+from types import MappingProxyType
+
+from mcp_client_for_ollama.memory.initializer import MemoryInitializer
 from mcp_client_for_ollama.memory.storage import MemoryStorage
 from mcp_client_for_ollama.memory.base_memory import FeatureStatus, GoalStatus
 
 
+# Sample output from INITIALIZER agent. bootstrap_from_json only reads its
+# input, so the tests share one read-only copy.
+SAMPLE_INITIALIZER_OUTPUT = MappingProxyType({
+    "domain": "coding",
+    "session_description": "Implement JWT authentication system",
+    "goals": [
+        {
+            "id": "G1",
+            "description": "Build authentication endpoints",
+            "constraints": [
+                "Use bcrypt for password hashing",
+                "JWT tokens expire in 24 hours"
+            ],
+            "features": [
+                {
+                    "id": "F1",
+                    "description": "POST /api/login endpoint",
+                    "criteria": [
+                        "Accepts username and password",
+                        "Returns JWT on success",
+                        "Returns 401 on failure"
+                    ],
+                    "tests": [
+                        "test_login_success",
+                        "test_login_failure"
+                    ],
+                    "priority": "high"
+                },
+                {
+                    "id": "F2",
+                    "description": "Password hashing with bcrypt",
+                    "criteria": [
+                        "Passwords never stored in plaintext",
+                        "Hash verification works correctly"
+                    ],
+                    "tests": [
+                        "test_password_hashing",
+                        "test_password_verification"
+                    ],
+                    "priority": "high"
+                }
+            ]
+        }
+    ],
+    "state": {
+        "test_harness": {
+            "framework": "pytest",
+            "test_dirs": ["tests/"],
+            "run_command": "pytest -v"
+        },
+        "scaffolding": {
+            "language": "python",
+            "required_files": ["README.md", "requirements.txt"]
+        }
+    },
+    "initial_artifacts": {
+        "README.md": "# Auth System\n\nJWT-based authentication"
+    }
+})
+
+
 class TestMemoryInitializer:
     """Tests for MemoryInitializer class."""
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create a temporary directory for storage tests."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    # Storage is shared by the class: every test that writes uses a fresh
+    # uuid-based session ID (or its own custom one), so tests don't collide.
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
+    def temp_storage_dir(self, memory_tmp_root):
+        """Storage directory shared by the tests in this class."""
+        return memory_tmp_root / "initializer"
+
+    @pytest.fixture(scope="class")
     def storage(self, temp_storage_dir):
         """Create a MemoryStorage instance with temp directory."""
         return MemoryStorage(base_dir=temp_storage_dir)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def initializer(self, storage):
         """Create a MemoryInitializer instance."""
         return MemoryInitializer(storage)
 
-    @pytest.fixture
-    def sample_initializer_output(self):
-        """Sample output from INITIALIZER agent."""
-        return {
-            "domain": "coding",
-            "session_description": "Implement JWT authentication system",
-            "goals": [
-                {
-                    "id": "G1",
-                    "description": "Build authentication endpoints",
-                    "constraints": [
-                        "Use bcrypt for password hashing",
-                        "JWT tokens expire in 24 hours"
-                    ],
-                    "features": [
-                        {
-                            "id": "F1",
-                            "description": "POST /api/login endpoint",
-                            "criteria": [
-                                "Accepts username and password",
-                                "Returns JWT on success",
-                                "Returns 401 on failure"
-                            ],
-                            "tests": [
-                                "test_login_success",
-                                "test_login_failure"
-                            ],
-                            "priority": "high"
-                        },
-                        {
-                            "id": "F2",
-                            "description": "Password hashing with bcrypt",
-                            "criteria": [
-                                "Passwords never stored in plaintext",
-                                "Hash verification works correctly"
-                            ],
-                            "tests": [
-                                "test_password_hashing",
-                                "test_password_verification"
-                            ],
-                            "priority": "high"
-                        }
-                    ]
-                }
-            ],
-            "state": {
-                "test_harness": {
-                    "framework": "pytest",
-                    "test_dirs": ["tests/"],
-                    "run_command": "pytest -v"
-                },
-                "scaffolding": {
-                    "language": "python",
-                    "required_files": ["README.md", "requirements.txt"]
-                }
-            },
-            "initial_artifacts": {
-                "README.md": "# Auth System\n\nJWT-based authentication"
-            }
-        }
+    @pytest.fixture(scope="class")
+    def bootstrapped_memory(self, initializer):
+        """Memory bootstrapped once from the sample output; tests only read it."""
+        return initializer.bootstrap_from_json(SAMPLE_INITIALIZER_OUTPUT)
 
     def test_create_session_id(self, initializer):
         """Test session ID generation."""
@@ -104,9 +105,9 @@ class TestMemoryInitializer:
         session_id_with_prefix = initializer.create_session_id(prefix="coding")
         assert session_id_with_prefix.startswith("coding_")
 
-    def test_bootstrap_from_json(self, initializer, sample_initializer_output):
+    def test_bootstrap_from_json(self, bootstrapped_memory):
         """Test creating DomainMemory from INITIALIZER output."""
-        memory = initializer.bootstrap_from_json(sample_initializer_output)
+        memory = bootstrapped_memory
 
         # Check metadata
         assert memory.metadata.domain == "coding"
@@ -132,11 +133,11 @@ class TestMemoryInitializer:
         assert len(memory.progress_log) == 1
         assert memory.progress_log[0].agent_type == "INITIALIZER"
 
-    def test_bootstrap_with_custom_session_id(self, initializer, sample_initializer_output):
+    def test_bootstrap_with_custom_session_id(self, initializer):
         """Test bootstrapping with custom session ID."""
         custom_id = "my_custom_session"
         memory = initializer.bootstrap_from_json(
-            sample_initializer_output,
+            SAMPLE_INITIALIZER_OUTPUT,
             session_id=custom_id
         )
 
@@ -187,9 +188,17 @@ class TestMemoryInitializer:
         assert "test_dirs" in state["test_harness"]  # Default preserved
         assert state["custom_field"] == "custom_value"
 
-    def test_create_initial_artifacts(self, initializer, storage, sample_initializer_output):
+    def test_initialize_state_not_shared(self, initializer):
+        """Test that each session gets its own state, not shared defaults."""
+        state = initializer._initialize_state("coding", {})
+        state["test_harness"]["framework"] = "unittest"
+
+        fresh = initializer._initialize_state("coding", {})
+        assert fresh["test_harness"]["framework"] == "pytest"
+
+    def test_create_initial_artifacts(self, bootstrapped_memory, storage):
         """Test creation of initial artifact files."""
-        memory = initializer.bootstrap_from_json(sample_initializer_output)
+        memory = bootstrapped_memory
 
         # Artifacts should be tracked
         assert "README.md" in memory.artifacts
@@ -206,9 +215,9 @@ class TestMemoryInitializer:
         content = readme_path.read_text()
         assert "Auth System" in content
 
-    def test_initialize_and_save(self, initializer, storage, sample_initializer_output):
+    def test_initialize_and_save(self, initializer, storage):
         """Test full initialization and persistence."""
-        memory = initializer.initialize_and_save(sample_initializer_output)
+        memory = initializer.initialize_and_save(SAMPLE_INITIALIZER_OUTPUT)
 
         # Should be saved to disk
         assert storage.session_exists(
@@ -225,101 +234,9 @@ class TestMemoryInitializer:
         assert loaded.metadata.session_id == memory.metadata.session_id
 
 
-class TestInitializerPromptBuilder:
-    """Tests for InitializerPromptBuilder class."""
-
-    def test_build_basic_prompt(self):
-        """Test building a basic prompt."""
-        prompt = InitializerPromptBuilder.build_prompt(
-            user_query="Build a login system",
-            domain="coding"
-        )
-
-        assert "Domain: coding" in prompt
-        assert "Build a login system" in prompt
-        assert "User Request:" in prompt
-
-    def test_build_prompt_with_context(self):
-        """Test building prompt with additional context."""
-        context = {
-            "existing_files": ["main.py", "utils.py"],
-            "constraints": ["Must use Python 3.10+"],
-            "preferences": {"test_framework": "pytest"}
-        }
-
-        prompt = InitializerPromptBuilder.build_prompt(
-            user_query="Add authentication",
-            domain="coding",
-            context=context
-        )
-
-        assert "Existing Files:" in prompt
-        assert "main.py" in prompt
-        assert "Constraints:" in prompt
-        assert "Python 3.10+" in prompt
-        assert "Preferences:" in prompt
-        assert "pytest" in prompt
-
-    def test_get_domain_guidance_coding(self):
-        """Test domain guidance for coding."""
-        guidance = InitializerPromptBuilder._get_domain_guidance("coding")
-
-        assert "programming language" in guidance.lower()
-        assert "test" in guidance.lower()
-
-    def test_get_domain_guidance_research(self):
-        """Test domain guidance for research."""
-        guidance = InitializerPromptBuilder._get_domain_guidance("research")
-
-        assert "hypothes" in guidance.lower()
-        assert "experiment" in guidance.lower()
-
-    def test_get_domain_guidance_unknown(self):
-        """Test domain guidance for unknown domain."""
-        guidance = InitializerPromptBuilder._get_domain_guidance("unknown_domain")
-
-        assert guidance == ""
-
-    def test_parse_initializer_response_valid_json(self):
-        """Test parsing valid JSON response."""
-        response = '{"domain": "coding", "goals": []}'
-        parsed = InitializerPromptBuilder.parse_initializer_response(response)
-
-        assert parsed["domain"] == "coding"
-        assert parsed["goals"] == []
-
-    def test_parse_initializer_response_with_code_fence(self):
-        """Test parsing JSON wrapped in code fence."""
-        response = '```json\n{"domain": "coding", "goals": []}\n```'
-        parsed = InitializerPromptBuilder.parse_initializer_response(response)
-
-        assert parsed["domain"] == "coding"
-
-    def test_parse_initializer_response_invalid_json(self):
-        """Test parsing invalid JSON."""
-        response = 'not valid json'
-
-        with pytest.raises(ValueError, match="Invalid JSON response"):
-            InitializerPromptBuilder.parse_initializer_response(response)
-
-    def test_parse_initializer_response_with_markdown(self):
-        """Test parsing JSON with markdown fence (common LLM output)."""
-        response = '```\n{"domain": "research", "goals": []}\n```'
-        parsed = InitializerPromptBuilder.parse_initializer_response(response)
-
-        assert parsed["domain"] == "research"
-
-
 class TestEndToEndInitialization:
     """End-to-end tests for memory initialization workflow."""
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create a temporary directory for storage tests."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
     @pytest.fixture
     def setup(self, temp_storage_dir):
         """Set up storage and initializer."""
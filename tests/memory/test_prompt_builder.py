@@ -0,0 +1,103 @@
+"""Tests for the INITIALIZER prompt builder."""
+
+import pytest
+
+from mcp_client_for_ollama.memory.initializer import InitializerPromptBuilder
+
+
+class TestInitializerPromptBuilder:
+    """Tests for InitializerPromptBuilder class."""
+
+    def test_build_basic_prompt(self):
+        """Test building a basic prompt."""
+        prompt = InitializerPromptBuilder.build_prompt(
+            user_query="Build a login system",
+            domain="coding"
+        )
+
+        assert "Domain: coding" in prompt
+        assert "Build a login system" in prompt
+        assert "User Request:" in prompt
+
+    def test_build_prompt_with_context(self):
+        """Test building prompt with additional context."""
+        context = {
+            "existing_files": ["main.py", "utils.py"],
+            "constraints": ["Must use Python 3.10+"],
+            "preferences": {"test_framework": "pytest"}
+        }
+
+        prompt = InitializerPromptBuilder.build_prompt(
+            user_query="Add authentication",
+            domain="coding",
+            context=context
+        )
+
+        assert "Existing Files:" in prompt
+        assert "main.py" in prompt
+        assert "Constraints:" in prompt
+        assert "Python 3.10+" in prompt
+        assert "Preferences:" in prompt
+        assert "pytest" in prompt
+
+    def test_get_domain_guidance_coding(self):
+        """Test domain guidance for coding."""
+        guidance = InitializerPromptBuilder._get_domain_guidance("coding")
+
+        assert "programming language" in guidance.lower()
+        assert "test" in guidance.lower()
+
+    def test_get_domain_guidance_research(self):
+        """Test domain guidance for research."""
+        guidance = InitializerPromptBuilder._get_domain_guidance("research")
+
+        assert "hypothes" in guidance.lower()
+        assert "experiment" in guidance.lower()
+
+    def test_get_domain_guidance_unknown(self):
+        """Test domain guidance for unknown domain."""
+        guidance = InitializerPromptBuilder._get_domain_guidance("unknown_domain")
+
+        assert guidance == ""
+
+    def test_parse_initializer_response_valid_json(self):
+        """Test parsing valid JSON response."""
+        response = '{"domain": "coding", "goals": []}'
+        parsed = InitializerPromptBuilder.parse_initializer_response(response)
+
+        assert parsed["domain"] == "coding"
+        assert parsed["goals"] == []
+
+    def test_parse_initializer_response_with_code_fence(self):
+        """Test parsing JSON wrapped in code fence."""
+        response = '```json\n{"domain": "coding", "goals": []}\n```'
+        parsed = InitializerPromptBuilder.parse_initializer_response(response)
+
+        assert parsed["domain"] == "coding"
+
+    def test_parse_initializer_response_invalid_json(self):
+        """Test parsing invalid JSON."""
+        response = 'not valid json'
+
+        with pytest.raises(ValueError, match="Invalid JSON response"):
+            InitializerPromptBuilder.parse_initializer_response(response)
+
+    def test_parse_initializer_response_with_markdown(self):
+        """Test parsing JSON with markdown fence (common LLM output)."""
+        response = '```\n{"domain": "research", "goals": []}\n```'
+        parsed = InitializerPromptBuilder.parse_initializer_response(response)
+
+        assert parsed["domain"] == "research"
+
+    def test_parse_initializer_response_first_fence_with_prose(self):
+        """Test that the first fenced JSON object is used when text surrounds it."""
+        response = (
+            'Here is the plan:\n'
+            '```json\n{"domain": "coding", "goals": [{"id": "G1"}]}\n```\n'
+            'Alternative:\n'
+            '```json\n{"domain": "research", "goals": []}\n```'
+        )
+        parsed = InitializerPromptBuilder.parse_initializer_response(response)
+
+        assert parsed["domain"] == "coding"
+        assert parsed["goals"] == [{"id": "G1"}]
@@ -0,0 +1,27 @@
+"""Benchmarks for the DomainMemory to_dict/from_dict round trip.
+
+Requires pytest-benchmark (in the dev dependency group). Skipped unless run
+with ``--benchmark-enable``.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from mcp_client_for_ollama.memory.base_memory import DomainMemory
+
+_FEATURES_PER_GOAL = 10
+
+
+@pytest.mark.parametrize("n_features", [10, 100, 1000])
+def test_round_trip_perf(benchmark, make_large_memory, n_features):
+    """Time to_dict followed by from_dict; the result must match the original."""
+    memory = make_large_memory(
+        n_features // _FEATURES_PER_GOAL, _FEATURES_PER_GOAL, with_progress=True
+    )
+    expected = memory.to_dict()
+
+    restored = benchmark(lambda: DomainMemory.from_dict(memory.to_dict()))
+
+    assert len(restored.get_all_features()) == n_features
+    assert restored.to_dict() == expected
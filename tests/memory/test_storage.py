@@ -1,9 +1,7 @@
 """Tests for memory storage layer."""
 
+import json
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from datetime import datetime
 
 from mcp_client_for_ollama.memory.storage import MemoryStorage
@@ -17,17 +15,13 @@ from mcp_client_for_ollama.memory.base_memory import (
 from mcp_client_for_ollama.memory.schemas import DomainType
 
 
+# Fixed timestamp so saved memory.json bytes are deterministic
+_NOW = datetime(2024, 1, 1)
+
+
 class TestMemoryStorage:
     """Tests for MemoryStorage class."""
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create a temporary directory for storage tests."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        # Cleanup
-        shutil.rmtree(temp_dir)
-
     @pytest.fixture
     def storage(self, temp_storage_dir):
         """Create a MemoryStorage instance with temp directory."""
@@ -40,8 +34,8 @@ class TestMemoryStorage:
             session_id="test_session_123",
             domain="coding",
             description="Test session for unit testing",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         memory = DomainMemory(metadata=metadata)
 
@@ -129,8 +123,8 @@ class TestMemoryStorage:
             session_id="test_session_456",
             domain="research",
             description="Research session",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         memory2 = DomainMemory(metadata=metadata2)
         storage.save_memory(memory2)
@@ -152,8 +146,8 @@ class TestMemoryStorage:
             session_id="test_session_456",
             domain="research",
             description="Research session",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         memory2 = DomainMemory(metadata=metadata2)
         storage.save_memory(memory2)
@@ -219,6 +213,48 @@ class TestMemoryStorage:
         backups = list(backups_dir.glob("memory_*.json"))
         assert len(backups) == 1
 
+    def test_backup_keeps_previous_contents(self, storage, sample_memory):
+        """Test that a backup holds the memory as it was before the save."""
+        session_id = sample_memory.metadata.session_id
+        domain = sample_memory.metadata.domain
+
+        storage.save_memory(sample_memory, create_backup=False)
+        memory_path = storage._get_memory_path(session_id, domain)
+        previous = memory_path.read_text()
+
+        sample_memory.add_progress_entry(
+            agent_type="CODER",
+            action="Updated code",
+            outcome=OutcomeType.SUCCESS,
+            details="Made changes",
+        )
+        storage.save_memory(sample_memory, create_backup=True)
+
+        backups_dir = storage._get_backups_dir(session_id, domain)
+        (backup,) = backups_dir.glob("memory_*.json")
+        assert backup.read_text() == previous
+        assert memory_path.read_text() != previous
+        assert not list(memory_path.parent.glob("*.tmp"))
+
+    def test_failed_save_removes_temp_file(self, storage, sample_memory, monkeypatch):
+        """Test that a failed save leaves memory.json intact and no temp file behind."""
+        storage.save_memory(sample_memory)
+        memory_path = storage._get_memory_path(
+            sample_memory.metadata.session_id,
+            sample_memory.metadata.domain,
+        )
+        previous = memory_path.read_bytes()
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("mcp_client_for_ollama.memory.storage.os.replace", failing_replace)
+        with pytest.raises(IOError, match="disk full"):
+            storage.save_memory(sample_memory, create_backup=False)
+
+        assert memory_path.read_bytes() == previous
+        assert not list(memory_path.parent.glob("*.tmp"))
+
     def test_get_artifacts_path(self, storage, sample_memory):
         """Test getting artifacts directory path."""
         session_id = sample_memory.metadata.session_id
@@ -269,6 +305,21 @@ class TestMemoryStorage:
         assert "INITIALIZER" in content
         assert "Created session" in content
 
+    def test_memory_file_format(self, storage, sample_memory):
+        """Test that memory.json is indented UTF-8 JSON matching to_dict."""
+        sample_memory.metadata.description = "Café résumé ✓"
+        storage.save_memory(sample_memory)
+
+        memory_path = storage._get_memory_path(
+            sample_memory.metadata.session_id,
+            sample_memory.metadata.domain,
+        )
+        content = memory_path.read_text(encoding="utf-8")
+
+        assert json.loads(content) == sample_memory.to_dict()
+        assert content.startswith('{\n  "metadata": {\n    "session_id"')
+        assert "Café résumé ✓" in content
+
     def test_cleanup_old_backups(self, storage, sample_memory, temp_storage_dir):
         """Test that old backups are cleaned up."""
         session_id = sample_memory.metadata.session_id
@@ -286,9 +337,9 @@ class TestMemoryStorage:
         # Run cleanup (keep 10)
         storage._cleanup_old_backups(backups_dir, keep=10)
 
-        # Should only have 10 remaining
-        remaining = list(backups_dir.glob("memory_*.json"))
-        assert len(remaining) == 10
+        # Should only have the 10 most recent remaining
+        remaining = sorted(p.name for p in backups_dir.glob("memory_*.json"))
+        assert remaining == [f"memory_2024010{i:02d}_120000.json" for i in range(5, 15)]
 
     def test_completion_percentage_in_session_list(self, storage):
         """Test that session list includes completion percentage."""
@@ -296,8 +347,8 @@ class TestMemoryStorage:
             session_id="test_completion",
             domain="coding",
             description="Test",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         memory = DomainMemory(metadata=metadata)
 
@@ -316,3 +367,25 @@ class TestMemoryStorage:
         assert sessions[0]["completion_percentage"] == 50.0
         assert sessions[0]["total_features"] == 2
         assert sessions[0]["completed_features"] == 1
+
+    def test_list_sessions_reflects_updates(self, storage, sample_memory):
+        """Test that cached session summaries are refreshed after a save."""
+        from mcp_client_for_ollama.memory.base_memory import FeatureStatus
+        storage.save_memory(sample_memory)
+
+        (session,) = storage.list_sessions(domain="coding")
+        assert session["completed_features"] == 0
+
+        # Returned dicts are copies; changing one doesn't affect later calls
+        session["completed_features"] = 99
+        assert storage.list_sessions(domain="coding")[0]["completed_features"] == 0
+
+        sample_memory.goals[0].features[0].status = FeatureStatus.COMPLETED
+        storage.save_memory(sample_memory)
+
+        (session,) = storage.list_sessions(domain="coding")
+        assert session["completed_features"] == 1
+        assert session["completion_percentage"] == 50.0
+
+        storage.delete_session(sample_memory.metadata.session_id, "coding")
+        assert storage.list_sessions() == []
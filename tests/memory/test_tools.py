@@ -1,9 +1,6 @@
 """Tests for memory tools."""
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from datetime import datetime
 
 from mcp_client_for_ollama.memory.tools import MemoryTools
@@ -17,29 +14,22 @@ from mcp_client_for_ollama.memory.base_memory import (
 )
 
 
-class TestMemoryTools:
-    """Tests for MemoryTools class."""
+# Fixed timestamp so saved memory.json bytes are deterministic
+_NOW = datetime(2024, 1, 1)
 
-    @pytest.fixture
-    def temp_storage_dir(self):
-        """Create temporary storage directory."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
 
-    @pytest.fixture
-    def setup(self, temp_storage_dir):
-        """Set up storage, tools, and sample memory."""
-        storage = MemoryStorage(base_dir=temp_storage_dir)
-        tools = MemoryTools(storage)
+class TestMemoryTools:
+    """Tests for MemoryTools class."""
 
-        # Create sample memory
+    @pytest.fixture(scope="class")
+    def sample_memory_file(self, memory_tmp_root):
+        """Build and save the sample memory once; return its memory.json bytes."""
         metadata = MemoryMetadata(
             session_id="test_session",
             domain="coding",
             description="Test session",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
 
         goal = Goal(id="G1", description="Test goal")
@@ -61,16 +51,40 @@ class TestMemoryTools:
         ]
 
         memory = DomainMemory(metadata=metadata, goals=[goal])
+        storage = MemoryStorage(base_dir=memory_tmp_root / "tools_template")
         storage.save_memory(memory)
 
+        return storage._get_memory_path("test_session", "coding").read_bytes()
+
+    @staticmethod
+    def _make_tools(base_dir, memory_bytes):
+        """Storage under base_dir holding the sample memory.json, plus tools on it."""
+        storage = MemoryStorage(base_dir=base_dir)
+        tools = MemoryTools(storage)
+
+        # Drop in the saved memory.json; the tools only go through load/save_memory
+        memory_path = storage._get_memory_path("test_session", "coding")
+        memory_path.parent.mkdir(parents=True)
+        memory_path.write_bytes(memory_bytes)
+
         # Set current session
         tools.set_current_session("test_session", "coding")
 
-        return storage, tools, memory
+        return storage, tools
+
+    @pytest.fixture
+    def setup(self, temp_storage_dir, sample_memory_file):
+        """Set up storage and tools on the sample memory for tests that write."""
+        return self._make_tools(temp_storage_dir, sample_memory_file)
+
+    @pytest.fixture(scope="class")
+    def setup_ro(self, memory_tmp_root, sample_memory_file):
+        """Storage and tools on the sample memory, shared by tests that never save."""
+        return self._make_tools(memory_tmp_root / "tools_ro", sample_memory_file)
 
     def test_update_feature_status(self, setup):
         """Test updating feature status."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         result = tools.update_feature_status(
             feature_id="F1",
@@ -87,9 +101,9 @@ class TestMemoryTools:
         assert feature.status == FeatureStatus.IN_PROGRESS
         assert "Started implementation" in feature.notes
 
-    def test_update_feature_status_invalid_status(self, setup):
+    def test_update_feature_status_invalid_status(self, setup_ro):
         """Test updating with invalid status."""
-        storage, tools, memory = setup
+        storage, tools = setup_ro
 
         result = tools.update_feature_status(
             feature_id="F1",
@@ -98,9 +112,9 @@ class TestMemoryTools:
 
         assert "Error: Invalid status" in result
 
-    def test_update_feature_status_not_found(self, setup):
+    def test_update_feature_status_not_found(self, setup_ro):
         """Test updating non-existent feature."""
-        storage, tools, memory = setup
+        storage, tools = setup_ro
 
         result = tools.update_feature_status(
             feature_id="F99",
@@ -109,9 +123,9 @@ class TestMemoryTools:
 
         assert "Error: Feature 'F99' not found" in result
 
-    def test_update_feature_status_no_session(self):
+    def test_update_feature_status_no_session(self, temp_storage_dir):
         """Test updating without active session."""
-        storage = MemoryStorage()
+        storage = MemoryStorage(base_dir=temp_storage_dir)
         tools = MemoryTools(storage)
 
         result = tools.update_feature_status("F1", "completed")
@@ -120,7 +134,7 @@ class TestMemoryTools:
 
     def test_log_progress(self, setup):
         """Test logging progress."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         result = tools.log_progress(
             agent_type="CODER",
@@ -143,9 +157,9 @@ class TestMemoryTools:
         assert latest.action == "Implemented feature"
         assert latest.feature_id == "F1"
 
-    def test_log_progress_invalid_outcome(self, setup):
+    def test_log_progress_invalid_outcome(self, setup_ro):
         """Test logging with invalid outcome."""
-        storage, tools, memory = setup
+        storage, tools = setup_ro
 
         result = tools.log_progress(
             agent_type="CODER",
@@ -158,7 +172,7 @@ class TestMemoryTools:
 
     def test_add_test_result_pass(self, setup):
         """Test adding passing test result."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         result = tools.add_test_result(
             feature_id="F1",
@@ -178,7 +192,7 @@ class TestMemoryTools:
 
     def test_add_test_result_fail(self, setup):
         """Test adding failing test result."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         result = tools.add_test_result(
             feature_id="F1",
@@ -197,7 +211,7 @@ class TestMemoryTools:
 
     def test_add_test_result_auto_updates_status(self, setup):
         """Test that adding test results auto-updates feature status."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         # Add passing test
         tools.add_test_result("F1", "test_1", True)
@@ -207,9 +221,9 @@ class TestMemoryTools:
         feature = loaded.get_feature_by_id("F1")
         assert feature.status == FeatureStatus.COMPLETED
 
-    def test_get_memory_state(self, setup):
+    def test_get_memory_state(self, setup_ro):
         """Test getting memory state summary."""
-        storage, tools, memory = setup
+        storage, tools = setup_ro
 
         result = tools.get_memory_state()
 
@@ -219,9 +233,9 @@ class TestMemoryTools:
         assert "G1: Test goal" in result
         assert "F1: Feature 1" in result
 
-    def test_get_feature_details(self, setup):
+    def test_get_feature_details(self, setup_ro):
         """Test getting feature details."""
-        storage, tools, memory = setup
+        storage, tools = setup_ro
 
         result = tools.get_feature_details("F1")
 
@@ -231,17 +245,17 @@ class TestMemoryTools:
         assert "Criterion 1" in result
         assert "test_1" in result
 
-    def test_get_feature_details_not_found(self, setup):
+    def test_get_feature_details_not_found(self, setup_ro):
         """Test getting details for non-existent feature."""
-        storage, tools, memory = setup
+        storage, tools = setup_ro
 
         result = tools.get_feature_details("F99")
 
         assert "Error: Feature 'F99' not found" in result
 
-    def test_set_current_session(self):
+    def test_set_current_session(self, temp_storage_dir):
         """Test setting current session."""
-        storage = MemoryStorage()
+        storage = MemoryStorage(base_dir=temp_storage_dir)
         tools = MemoryTools(storage)
 
         assert tools.current_session_id is None
@@ -254,7 +268,7 @@ class TestMemoryTools:
 
     def test_update_feature_status_updates_goal(self, setup):
         """Test that updating features updates parent goal."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         # Complete both features
         tools.update_feature_status("F1", "completed")
@@ -267,7 +281,7 @@ class TestMemoryTools:
 
     def test_add_goal_with_custom_id(self, setup):
         """Test adding goal with custom ID (e.g., G_LORE_KEEPER)."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         # Add goal with custom ID
         result = tools.add_goal(
@@ -291,7 +305,7 @@ class TestMemoryTools:
 
     def test_add_goal_auto_generate_id(self, setup):
         """Test adding goal without custom ID auto-generates numeric ID."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         # Add goal without custom ID
         result = tools.add_goal(
@@ -308,7 +322,7 @@ class TestMemoryTools:
 
     def test_add_goal_duplicate_id_error(self, setup):
         """Test that adding goal with duplicate ID returns error."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         # Try to add goal with existing ID
         result = tools.add_goal(
@@ -325,7 +339,7 @@ class TestMemoryTools:
 
     def test_add_goal_custom_and_auto_ids_coexist(self, setup):
         """Test that custom and auto-generated IDs can coexist."""
-        storage, tools, memory = setup
+        storage, tools = setup
 
         # Add custom ID goal
         tools.add_goal(
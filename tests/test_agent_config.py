@@ -2,63 +2,64 @@
 
 import pytest
 import json
-import tempfile
-import shutil
-from pathlib import Path
+from dataclasses import replace
+from types import MappingProxyType
 from mcp_client_for_ollama.agents.agent_config import AgentConfig
 
 
+# Definition data and its serialized form, built once at import. Tests that
+# change the data work on a copy.
+_BASIC_CONFIG_DATA = {
+    "agent_type": "READER",
+    "display_name": "File Reader",
+    "description": "Reads and analyzes file contents",
+    "system_prompt": "You are a file reader agent.",
+    "default_tools": ["builtin.read_file", "builtin.list_files"]
+}
+_BASIC_CONFIG_JSON = json.dumps(_BASIC_CONFIG_DATA).encode()
+
+_FULL_CONFIG_DATA = {
+    "agent_type": "CODER",
+    "display_name": "Code Writer",
+    "description": "Writes and modifies code files",
+    "system_prompt": "You are a code writer agent.",
+    "default_tools": ["builtin.read_file", "builtin.write_file"],
+    "allowed_tool_categories": ["file_operations"],
+    "forbidden_tools": ["builtin.execute_bash_command"],
+    "max_context_tokens": 16384,
+    "loop_limit": 3,
+    "temperature": 0.7,
+    "planning_hints": "Use CODER for writing code",
+    "output_format": {"type": "code", "language": "python"}
+}
+_FULL_CONFIG_JSON = json.dumps(_FULL_CONFIG_DATA).encode()
+
+
 class TestAgentConfig:
     """Tests for AgentConfig class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def basic_config_data(self):
         """Basic valid agent configuration data."""
-        return {
-            "agent_type": "READER",
-            "display_name": "File Reader",
-            "description": "Reads and analyzes file contents",
-            "system_prompt": "You are a file reader agent.",
-            "default_tools": ["builtin.read_file", "builtin.list_files"]
-        }
+        return _BASIC_CONFIG_DATA
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def full_config_data(self):
         """Complete agent configuration data with all fields."""
-        return {
-            "agent_type": "CODER",
-            "display_name": "Code Writer",
-            "description": "Writes and modifies code files",
-            "system_prompt": "You are a code writer agent.",
-            "default_tools": ["builtin.read_file", "builtin.write_file"],
-            "allowed_tool_categories": ["file_operations"],
-            "forbidden_tools": ["builtin.execute_bash_command"],
-            "max_context_tokens": 16384,
-            "loop_limit": 3,
-            "temperature": 0.7,
-            "planning_hints": "Use CODER for writing code",
-            "output_format": {"type": "code", "language": "python"}
-        }
+        return _FULL_CONFIG_DATA
 
-    @pytest.fixture
-    def temp_definitions_dir(self, basic_config_data, full_config_data):
-        """Create a temporary definitions directory with test agent files."""
-        temp_dir = tempfile.mkdtemp()
+    @pytest.fixture(scope="module")
+    def temp_definitions_dir(self, tmp_path_factory):
+        """Create a definitions directory with test agent files; tests only read it."""
+        definitions_dir = tmp_path_factory.mktemp("defs")
 
         # Create basic config file
-        reader_path = Path(temp_dir) / "reader.json"
-        with open(reader_path, 'w') as f:
-            json.dump(basic_config_data, f)
+        (definitions_dir / "reader.json").write_bytes(_BASIC_CONFIG_JSON)
 
         # Create full config file
-        coder_path = Path(temp_dir) / "coder.json"
-        with open(coder_path, 'w') as f:
-            json.dump(full_config_data, f)
+        (definitions_dir / "coder.json").write_bytes(_FULL_CONFIG_JSON)
 
-        yield temp_dir
-
-        # Cleanup
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        return str(definitions_dir)
 
     def test_agent_config_creation_with_defaults(self):
         """Test creating AgentConfig with minimal required fields."""
@@ -83,6 +84,20 @@ class TestAgentConfig:
         assert config.planning_hints is None
         assert config.output_format is None
 
+    def test_agent_config_uses_slots(self):
+        """Test that AgentConfig instances carry no per-instance __dict__."""
+        config = AgentConfig(
+            agent_type="TEST",
+            display_name="Test Agent",
+            description="Test description",
+            system_prompt="Test prompt",
+            default_tools=[]
+        )
+
+        assert not hasattr(config, "__dict__")
+        with pytest.raises(AttributeError):
+            config.unknown_field = True
+
     def test_agent_config_creation_with_all_fields(self):
         """Test creating AgentConfig with all fields specified."""
         config = AgentConfig(
@@ -109,83 +124,113 @@ class TestAgentConfig:
         assert config.planning_hints == "Use for custom tasks"
         assert config.output_format == {"type": "json"}
 
-    def test_from_json_file_basic(self, basic_config_data):
+    @pytest.mark.parametrize("config_json,expected", [
+        (_BASIC_CONFIG_JSON, {
+            "agent_type": "READER",
+            "display_name": "File Reader",
+            "description": "Reads and analyzes file contents",
+            "system_prompt": "You are a file reader agent.",
+            "default_tools": ["builtin.read_file", "builtin.list_files"],
+            # Defaults
+            "max_context_tokens": 8192,
+            "loop_limit": 2,
+            "temperature": 0.5,
+        }),
+        (_FULL_CONFIG_JSON, {
+            "agent_type": "CODER",
+            "display_name": "Code Writer",
+            "allowed_tool_categories": ["file_operations"],
+            "forbidden_tools": ["builtin.execute_bash_command"],
+            "max_context_tokens": 16384,
+            "loop_limit": 3,
+            "temperature": 0.7,
+            "planning_hints": "Use CODER for writing code",
+            "output_format": {"type": "code", "language": "python"},
+        }),
+    ], ids=["basic", "full"])
+    def test_from_json_file(self, tmp_path, config_json, expected):
         """Test loading agent config from JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(basic_config_data, f)
-            temp_path = f.name
-
-        try:
-            config = AgentConfig.from_json_file(temp_path)
-
-            assert config.agent_type == "READER"
-            assert config.display_name == "File Reader"
-            assert config.description == "Reads and analyzes file contents"
-            assert config.system_prompt == "You are a file reader agent."
-            assert config.default_tools == ["builtin.read_file", "builtin.list_files"]
-            # Check defaults
-            assert config.max_context_tokens == 8192
-            assert config.loop_limit == 2
-            assert config.temperature == 0.5
-        finally:
-            Path(temp_path).unlink()
-
-    def test_from_json_file_full(self, full_config_data):
-        """Test loading complete agent config from JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(full_config_data, f)
-            temp_path = f.name
-
-        try:
-            config = AgentConfig.from_json_file(temp_path)
-
-            assert config.agent_type == "CODER"
-            assert config.display_name == "Code Writer"
-            assert config.allowed_tool_categories == ["file_operations"]
-            assert config.forbidden_tools == ["builtin.execute_bash_command"]
-            assert config.max_context_tokens == 16384
-            assert config.loop_limit == 3
-            assert config.temperature == 0.7
-            assert config.planning_hints == "Use CODER for writing code"
-            assert config.output_format == {"type": "code", "language": "python"}
-        finally:
-            Path(temp_path).unlink()
-
-    def test_from_json_file_missing_required_field(self):
-        """Test that loading JSON with missing required fields raises KeyError."""
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(config_json)
+
+        config = AgentConfig.from_json_file(str(config_file))
+
+        assert {field: getattr(config, field) for field in expected} == expected
+
+    def test_from_json_file_invalid_json(self, tmp_path):
+        """Test loading a file that isn't valid JSON."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text("This is not valid JSON{]")
+
+        with pytest.raises(json.JSONDecodeError):
+            AgentConfig.from_json_file(str(config_file))
+
+    def test_from_dict_matches_to_dict(self, full_config_data):
+        """Test that from_dict builds the same config to_dict describes."""
+        config = AgentConfig.from_dict(full_config_data)
+
+        assert config.to_dict() == {**config.to_dict(), **full_config_data}
+        assert config.default_tools is not full_config_data["default_tools"]
+
+    def test_from_dict_missing_required_field(self):
+        """Test that missing required fields raise KeyError."""
         incomplete_data = {
             "agent_type": "INCOMPLETE",
             "display_name": "Incomplete Agent"
-            # Missing required fields
+            # Missing description, system_prompt, default_tools
         }
 
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(incomplete_data, f)
-            temp_path = f.name
-
-        try:
-            with pytest.raises(KeyError):
-                AgentConfig.from_json_file(temp_path)
-        finally:
-            Path(temp_path).unlink()
-
-    def test_from_json_file_invalid_json(self):
-        """Test that loading invalid JSON raises JSONDecodeError."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("This is not valid JSON{]")
-            temp_path = f.name
-
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                AgentConfig.from_json_file(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        with pytest.raises(KeyError):
+            AgentConfig.from_dict(incomplete_data)
 
     def test_from_json_file_not_found(self):
         """Test that loading nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             AgentConfig.from_json_file("/nonexistent/path/to/config.json")
 
+    def test_from_json_file_cached_until_changed(self, basic_config_data, tmp_path):
+        """Test that repeat loads reuse the parse but pick up file changes."""
+        data = dict(basic_config_data)
+        config_file = tmp_path / "reader.json"
+        config_file.write_text(json.dumps(data))
+
+        first = AgentConfig.from_json_file(str(config_file))
+        first.default_tools.append("builtin.write_file")
+        second = AgentConfig.from_json_file(str(config_file))
+        assert second.default_tools == ["builtin.read_file", "builtin.list_files"]
+
+        data["display_name"] = "Updated File Reader"
+        config_file.write_text(json.dumps(data))
+        third = AgentConfig.from_json_file(str(config_file))
+        assert third.display_name == "Updated File Reader"
+
+    def test_from_json_file_configs_do_not_share_cached_data(self, tmp_path):
+        """Test that changing one loaded config doesn't leak into the next load."""
+        config_file = tmp_path / "config.json"
+        config_file.write_bytes(_FULL_CONFIG_JSON)
+
+        first = AgentConfig.from_json_file(str(config_file))
+        first.output_format["language"] = "rust"
+        first.default_tools.append("builtin.extra")
+        first.forbidden_tools.clear()
+
+        second = AgentConfig.from_json_file(str(config_file))
+        assert second.output_format == {"type": "code", "language": "python"}
+        assert second.default_tools == ["builtin.read_file", "builtin.write_file"]
+        assert second.forbidden_tools == ["builtin.execute_bash_command"]
+
+    def test_from_json_file_interns_short_strings(self, basic_config_data, tmp_path):
+        """Test that short values repeated across definition files share one string object."""
+        first_file = tmp_path / "first.json"
+        second_file = tmp_path / "second.json"
+        first_file.write_bytes(_BASIC_CONFIG_JSON)
+        second_file.write_text(json.dumps({**basic_config_data, "agent_type": "SECOND_READER"}))
+
+        first = AgentConfig.from_json_file(str(first_file))
+        second = AgentConfig.from_json_file(str(second_file))
+
+        assert first.default_tools[0] is second.default_tools[0]
+
     def test_load_all_definitions(self, temp_definitions_dir):
         """Test loading all agent definitions from directory."""
         configs = AgentConfig.load_all_definitions(temp_definitions_dir)
@@ -202,184 +247,103 @@ class TestAgentConfig:
         assert coder.display_name == "Code Writer"
         assert coder.max_context_tokens == 16384
 
-    def test_load_all_definitions_default_path(self):
-        """Test loading from default definitions directory."""
+    def test_load_all_definitions_default_path(self, capsys):
+        """Test that every shipped agent definition loads."""
         # This should load actual agent definitions from the project
         configs = AgentConfig.load_all_definitions()
 
-        # Should have at least the basic agent types
-        assert len(configs) > 0
-        # Check for known agent types (adjust based on actual definitions)
-        assert "PLANNER" in configs or "READER" in configs
+        # Invalid files are skipped with a printed warning; none should be
+        assert "Warning: Failed to load" not in capsys.readouterr().out
+        assert "PLANNER" in configs
+        assert "READER" in configs
 
     def test_load_all_definitions_nonexistent_dir(self):
         """Test that loading from nonexistent directory raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             AgentConfig.load_all_definitions("/nonexistent/definitions")
 
-    def test_load_all_definitions_with_invalid_file(self, temp_definitions_dir):
+    def test_load_all_definitions_with_invalid_file(self, tmp_path, capsys):
         """Test that invalid files are skipped with a warning."""
+        (tmp_path / "reader.json").write_bytes(_BASIC_CONFIG_JSON)
+        (tmp_path / "coder.json").write_bytes(_FULL_CONFIG_JSON)
+
         # Create an invalid JSON file
-        invalid_path = Path(temp_definitions_dir) / "invalid.json"
-        with open(invalid_path, 'w') as f:
-            f.write("Not valid JSON{]")
+        (tmp_path / "invalid.json").write_text("Not valid JSON{]")
 
         # Should still load valid files and skip invalid one
-        configs = AgentConfig.load_all_definitions(temp_definitions_dir)
+        configs = AgentConfig.load_all_definitions(str(tmp_path))
 
         # Should have the 2 valid configs, invalid one skipped
-        assert len(configs) == 2
-        assert "READER" in configs
-        assert "CODER" in configs
+        assert sorted(configs) == ["CODER", "READER"]
+        assert "Warning: Failed to load invalid.json" in capsys.readouterr().out
 
-    def test_get_effective_tools_basic(self):
-        """Test get_effective_tools with simple case."""
-        config = AgentConfig(
+    @pytest.fixture(scope="class")
+    def base_config(self):
+        """Minimal config built once; tests derive variants with dataclasses.replace."""
+        return AgentConfig(
             agent_type="TEST",
             display_name="Test",
             description="Test",
             system_prompt="Test",
-            default_tools=["builtin.tool1", "builtin.tool2", "builtin.tool3"]
+            default_tools=[]
         )
 
+    @pytest.mark.parametrize("default_tools,forbidden_tools,available_tools,expected", [
         # MCP server tools (no builtin prefix) are auto-added
-        available_tools = ["builtin.tool1", "builtin.tool2", "builtin.tool3", "mcp-server.tool4"]
-        effective = config.get_effective_tools(available_tools)
-
-        # Should get default builtin tools + MCP server tool
-        assert set(effective) == {"builtin.tool1", "builtin.tool2", "builtin.tool3", "mcp-server.tool4"}
-
-    def test_get_effective_tools_with_forbidden(self):
-        """Test that forbidden tools are excluded."""
-        config = AgentConfig(
-            agent_type="TEST",
-            display_name="Test",
-            description="Test",
-            system_prompt="Test",
-            default_tools=["builtin.tool1", "builtin.tool2", "builtin.tool3"],
-            forbidden_tools=["builtin.tool2", "mcp-server.tool4"]
-        )
-
-        available_tools = ["builtin.tool1", "builtin.tool2", "builtin.tool3", "mcp-server.tool4", "mcp-server.tool5"]
-        effective = config.get_effective_tools(available_tools)
-
-        # Should exclude forbidden tools but include other MCP tools
-        assert set(effective) == {"builtin.tool1", "builtin.tool3", "mcp-server.tool5"}
-        assert "builtin.tool2" not in effective
-        assert "mcp-server.tool4" not in effective
-
-    def test_get_effective_tools_unavailable_filtered(self):
-        """Test that unavailable tools are filtered out."""
-        config = AgentConfig(
-            agent_type="TEST",
-            display_name="Test",
-            description="Test",
-            system_prompt="Test",
-            default_tools=["tool1", "tool2", "tool3"]
-        )
-
+        (["builtin.tool1", "builtin.tool2", "builtin.tool3"], [],
+         ["builtin.tool1", "builtin.tool2", "builtin.tool3", "mcp-server.tool4"],
+         ["builtin.tool1", "builtin.tool2", "builtin.tool3", "mcp-server.tool4"]),
+        # Forbidden tools are excluded, other MCP tools still included
+        (["builtin.tool1", "builtin.tool2", "builtin.tool3"], ["builtin.tool2", "mcp-server.tool4"],
+         ["builtin.tool1", "builtin.tool2", "builtin.tool3", "mcp-server.tool4", "mcp-server.tool5"],
+         ["builtin.tool1", "builtin.tool3", "mcp-server.tool5"]),
         # Only tool1 and tool3 are available
-        available_tools = ["tool1", "tool3"]
-        effective = config.get_effective_tools(available_tools)
-
-        assert set(effective) == {"tool1", "tool3"}
-        assert "tool2" not in effective
-
-    def test_get_effective_tools_empty_available(self):
-        """Test get_effective_tools when no tools are available."""
-        config = AgentConfig(
-            agent_type="TEST",
-            display_name="Test",
-            description="Test",
-            system_prompt="Test",
-            default_tools=["tool1", "tool2"]
-        )
-
-        effective = config.get_effective_tools([])
-        assert effective == []
-
-    def test_get_effective_tools_empty_default(self):
-        """Test get_effective_tools when agent has no default tools."""
-        config = AgentConfig(
-            agent_type="TEST",
-            display_name="Test",
-            description="Test",
-            system_prompt="Test",
-            default_tools=[]
-        )
-
+        (["tool1", "tool2", "tool3"], [], ["tool1", "tool3"], ["tool1", "tool3"]),
+        (["tool1", "tool2"], [], [], []),
         # Even with no default tools, MCP server tools are auto-added
-        available_tools = ["mcp-server.tool1", "mcp-server.tool2"]
-        effective = config.get_effective_tools(available_tools)
-        assert set(effective) == {"mcp-server.tool1", "mcp-server.tool2"}
-
-    def test_matches_tool_category_no_restrictions(self):
-        """Test that agents with no category restrictions match all tools."""
-        config = AgentConfig(
-            agent_type="TEST",
-            display_name="Test",
-            description="Test",
-            system_prompt="Test",
-            default_tools=[],
-            allowed_tool_categories=[]
-        )
-
-        tool_categories = {
-            "file_ops": ["read", "write"],
-            "execution": ["bash", "python"]
-        }
-
-        assert config.matches_tool_category("read", tool_categories) is True
-        assert config.matches_tool_category("bash", tool_categories) is True
-        assert config.matches_tool_category("unknown", tool_categories) is True
-
-    def test_matches_tool_category_with_restrictions(self):
-        """Test tool category matching with restrictions."""
-        config = AgentConfig(
-            agent_type="TEST",
-            display_name="Test",
-            description="Test",
-            system_prompt="Test",
-            default_tools=[],
-            allowed_tool_categories=["file_ops"]
-        )
-
-        tool_categories = {
-            "file_ops": ["read", "write"],
-            "execution": ["bash", "python"]
-        }
-
-        # Should match tools in allowed category
-        assert config.matches_tool_category("read", tool_categories) is True
-        assert config.matches_tool_category("write", tool_categories) is True
-
-        # Should not match tools in other categories
-        assert config.matches_tool_category("bash", tool_categories) is False
-        assert config.matches_tool_category("python", tool_categories) is False
-
-    def test_matches_tool_category_multiple_allowed(self):
-        """Test tool category matching with multiple allowed categories."""
-        config = AgentConfig(
-            agent_type="TEST",
-            display_name="Test",
-            description="Test",
-            system_prompt="Test",
-            default_tools=[],
-            allowed_tool_categories=["file_ops", "execution"]
-        )
+        ([], [], ["mcp-server.tool1", "mcp-server.tool2"], ["mcp-server.tool1", "mcp-server.tool2"]),
+    ], ids=["basic", "with_forbidden", "unavailable_filtered", "empty_available", "empty_default"])
+    def test_get_effective_tools(self, base_config, default_tools, forbidden_tools, available_tools, expected):
+        """Test get_effective_tools combines defaults, MCP tools and forbidden tools.
 
-        tool_categories = {
-            "file_ops": ["read", "write"],
-            "execution": ["bash", "python"],
-            "network": ["fetch", "post"]
-        }
+        expected is listed in sorted order and compared against the sorted
+        result, which also catches duplicate tool names.
+        """
+        config = replace(base_config, default_tools=default_tools, forbidden_tools=forbidden_tools)
 
-        # Should match tools in any allowed category
-        assert config.matches_tool_category("read", tool_categories) is True
-        assert config.matches_tool_category("bash", tool_categories) is True
+        effective = config.get_effective_tools(available_tools)
 
-        # Should not match tools in disallowed categories
-        assert config.matches_tool_category("fetch", tool_categories) is False
+        assert sorted(effective) == expected
+
+    @pytest.fixture(scope="class")
+    def tool_categories(self):
+        """Read-only category map shared by the category matching cases."""
+        return MappingProxyType({
+            "file_ops": ("read", "write"),
+            "execution": ("bash", "python"),
+            "network": ("fetch", "post"),
+        })
+
+    @pytest.mark.parametrize("allowed_categories,tool_name,expected", [
+        # No category restrictions match all tools
+        ([], "read", True),
+        ([], "bash", True),
+        ([], "unknown", True),
+        # Only tools in the allowed category match
+        (["file_ops"], "read", True),
+        (["file_ops"], "write", True),
+        (["file_ops"], "bash", False),
+        (["file_ops"], "python", False),
+        # Tools in any allowed category match
+        (["file_ops", "execution"], "read", True),
+        (["file_ops", "execution"], "bash", True),
+        (["file_ops", "execution"], "fetch", False),
+    ])
+    def test_matches_tool_category(self, base_config, tool_categories, allowed_categories, tool_name, expected):
+        """Test tool category matching against allowed categories."""
+        config = replace(base_config, allowed_tool_categories=allowed_categories)
+
+        assert config.matches_tool_category(tool_name, tool_categories) is expected
 
     def test_to_dict(self):
         """Test serialization to dictionary."""
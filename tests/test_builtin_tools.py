@@ -7,19 +7,33 @@ from unittest.mock import MagicMock
 from mcp import Tool
 from mcp_client_for_ollama.tools.builtin import BuiltinToolManager
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_model_config_manager():
-    """Fixture for a mocked ModelConfigManager."""
+    """Fixture for a mocked ModelConfigManager, shared by the module."""
     mock = MagicMock()
     mock.system_prompt = None
     mock.get_system_prompt.side_effect = lambda: mock.system_prompt
     return mock
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def builtin_tool_manager(mock_model_config_manager):
-    """Fixture for BuiltinToolManager with a mocked ModelConfigManager."""
+    """Fixture for BuiltinToolManager with a mocked ModelConfigManager, shared by the module."""
     return BuiltinToolManager(mock_model_config_manager)
 
+@pytest.fixture(autouse=True)
+def reset_shared_manager(mock_model_config_manager, builtin_tool_manager):
+    """Undo each test's changes to the shared manager and mock."""
+    working_directory = builtin_tool_manager.working_directory
+
+    yield
+
+    # reset_mock keeps get_system_prompt's side_effect
+    mock_model_config_manager.reset_mock()
+    mock_model_config_manager.system_prompt = None
+    builtin_tool_manager.working_directory = working_directory
+    builtin_tool_manager.memory_tools = None
+    builtin_tool_manager._approved_paths.clear()
+
 @pytest.fixture
 def temp_dir(builtin_tool_manager):
     """Fixture for creating a temporary directory for file operations."""
@@ -101,6 +115,28 @@ def test_get_builtin_tools(builtin_tool_manager):
         "required": ["command"]
     }
 
+def test_get_builtin_tools_cached(builtin_tool_manager):
+    """Test that tool definitions are built once and reused."""
+    first = builtin_tool_manager.get_builtin_tools()
+    second = builtin_tool_manager.get_builtin_tools()
+
+    assert first == second
+    assert first is not second  # callers get their own list
+    assert all(a is b for a, b in zip(first, second))
+    assert builtin_tool_manager.get_builtin_tool("builtin.patch_file") in first
+    assert builtin_tool_manager.get_builtin_tool("builtin.nonexistent") is None
+
+def test_get_builtin_tools_with_memory(builtin_tool_manager):
+    """Test that enabling memory tools adds them to the cached list."""
+    without_memory = builtin_tool_manager.get_builtin_tools()
+    assert builtin_tool_manager.get_builtin_tool("builtin.log_progress") is None
+
+    builtin_tool_manager.set_memory_tools(MagicMock())
+    with_memory = builtin_tool_manager.get_builtin_tools()
+
+    assert len(with_memory) > len(without_memory)
+    assert builtin_tool_manager.get_builtin_tool("builtin.log_progress") is not None
+
 def test_execute_tool_set_system_prompt_success(builtin_tool_manager, mock_model_config_manager):
     """Test setting the system prompt successfully."""
     tool_args = {"prompt": "You are a helpful AI assistant."}
@@ -246,6 +282,24 @@ def test_write_file_overwrite(builtin_tool_manager, temp_dir):
     with open(test_file, 'r') as f:
         assert f.read() == "new content"
 
+def test_write_file_replaces_atomically(builtin_tool_manager, temp_dir):
+    """Test that overwriting keeps file permissions and leaves no temporary files."""
+    test_file = os.path.join(temp_dir, "script.sh")
+    with open(test_file, 'w') as f:
+        f.write("echo old\n")
+    os.chmod(test_file, 0o755)
+
+    result = builtin_tool_manager.execute_tool("write_file", {
+        "path": "script.sh",
+        "content": "echo new\n"
+    })
+    assert "written successfully" in result
+
+    with open(test_file, 'r') as f:
+        assert f.read() == "echo new\n"
+    assert os.stat(test_file).st_mode & 0o777 == 0o755
+    assert os.listdir(temp_dir) == ["script.sh"]
+
 def test_write_file_missing_args(builtin_tool_manager, temp_dir):
     """Test writing a file with missing arguments."""
     result = builtin_tool_manager.execute_tool("write_file", {"path": "test.txt"})
@@ -254,6 +308,42 @@ def test_write_file_missing_args(builtin_tool_manager, temp_dir):
     result = builtin_tool_manager.execute_tool("write_file", {"content": "test"})
     assert "Error: 'path' argument is required" in result
 
+def test_patch_file_occurrence(builtin_tool_manager, temp_dir):
+    """Test replacing a specific occurrence of repeated text."""
+    test_file = os.path.join(temp_dir, "dup.txt")
+    with open(test_file, 'w') as f:
+        f.write("x = 1\nx = 1\nx = 1\n")
+
+    result = builtin_tool_manager.execute_tool("patch_file", {
+        "path": "dup.txt",
+        "changes": [{"search": "x = 1", "replace": "x = 2"}]
+    })
+    assert "appears 3 times" in result
+
+    result = builtin_tool_manager.execute_tool("patch_file", {
+        "path": "dup.txt",
+        "changes": [{"search": "x = 1", "replace": "x = 2", "occurrence": 2}]
+    })
+    assert "Replaced occurrence 2 of 3" in result
+
+    with open(test_file, 'r') as f:
+        assert f.read() == "x = 1\nx = 2\nx = 1\n"
+
+def test_patch_file_empty_search(builtin_tool_manager, temp_dir):
+    """Test that an empty search string is rejected and the file is left alone."""
+    test_file = os.path.join(temp_dir, "notes.txt")
+    with open(test_file, 'w') as f:
+        f.write("hello\n")
+
+    result = builtin_tool_manager.execute_tool("patch_file", {
+        "path": "notes.txt",
+        "changes": [{"search": "", "replace": "oops", "occurrence": 1}]
+    })
+    assert "Error: Change #1 has empty 'search' field." in result
+
+    with open(test_file, 'r') as f:
+        assert f.read() == "hello\n"
+
 def test_list_files_success(builtin_tool_manager, temp_dir):
     """Test listing files in a directory."""
     # Create some test files
@@ -434,6 +524,18 @@ def test_path_validation_complex_traversal(builtin_tool_manager, temp_dir):
     result = builtin_tool_manager.execute_tool("read_file", {"path": "subdir/../../etc/passwd"})
     assert "Path traversal outside working directory is not allowed" in result
 
+def test_path_validation_sibling_prefix(mock_model_config_manager, tmp_path):
+    """Test that a sibling directory sharing the name prefix is not inside the working directory."""
+    manager = BuiltinToolManager(mock_model_config_manager, working_directory=str(tmp_path / "work"))
+
+    is_valid, resolved = manager._validate_path("notes.txt", require_permission=False)
+    assert is_valid
+    assert resolved == str(tmp_path / "work" / "notes.txt")
+
+    is_valid, error = manager._validate_path("../work2/secret.txt", require_permission=False)
+    assert not is_valid
+    assert "Path traversal outside working directory is not allowed" in error
+
 
 # Gitignore Filtering Tests
 
@@ -191,8 +191,7 @@ class TestToolStatePersistence:
         persistence.set_server_enabled('obsidian', False)
 
         # Read config file directly
-        with open(persistence.config_file, 'r') as f:
-            config = json.load(f)
+        config = json.loads(persistence.config_file.read_bytes())
 
         assert 'disabledTools' in config
         assert 'disabledServers' in config
@@ -228,8 +227,7 @@ class TestToolStatePersistence:
         persistence.set_tool_enabled('filesystem.write', False)
 
         # Read config and verify other fields are preserved
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        config = json.loads(config_file.read_bytes())
 
         assert config['mcpServers'] == initial_config['mcpServers']
         assert config['delegation'] == initial_config['delegation']